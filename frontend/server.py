@@ -87,8 +87,8 @@ app.add_middleware(
 # Backend API URL
 BACKEND_API_URL = os.environ.get("BACKEND_API_URL", "http://localhost:8111")
 
-# Create temp uploads directory if not exists
-UPLOAD_DIR = os.path.join(base_dir, "uploads")
+# Create temp uploads directory if not exists; UPLOAD_DIR overrides the location (tests use a temp dir)
+UPLOAD_DIR = os.environ.get("UPLOAD_DIR", os.path.join(base_dir, "uploads"))
 if not os.path.exists(UPLOAD_DIR):
     os.makedirs(UPLOAD_DIR)
     logger.info(f"Created uploads directory: {UPLOAD_DIR}")
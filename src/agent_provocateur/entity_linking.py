@@ -5,18 +5,36 @@ This module provides advanced entity extraction, linking, and relationship detec
 capabilities for improved document analysis and research workflows.
 """
 
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import AsyncIterator, Dict, List, Any, Optional, Pattern, Tuple, Set
+import asyncio
 import re
 import logging
 import os
 import json
 import uuid
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
 from enum import Enum
 
 from .graphrag_client import GraphRAGClient
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+
+def _compile_pattern(pattern: str) -> Pattern[str]:
+    """Compile an extraction pattern, using linear-time RE2 when installed."""
+    if RE2_AVAILABLE:
+        return re2.compile(pattern)
+    return re.compile(pattern)
+
+
 class EntityType(str, Enum):
     """Entity types for enhanced entity linking."""
     PERSON = "person"
@@ -49,9 +67,91 @@ class RelationType(str, Enum):
     OTHER = "other"
 
 
+# Mention keys stored in MentionList's parallel arrays
+_MENTION_KEYS = frozenset(("text", "start", "end", "score"))
+
+
+class MentionList(Sequence):
+    """
+    Compact store for entity mentions.
+    
+    Offsets and scores are kept in parallel arrays rather than one dict per
+    mention. Indexing returns the usual mention dictionary with ``text``,
+    ``start``, ``end`` and ``score`` keys, plus any other keys the mention
+    was loaded with.
+    """
+    
+    __slots__ = ("_texts", "_starts", "_ends", "_scores", "_extras")
+    
+    def __init__(self, mentions: Optional[List[Dict[str, Any]]] = None):
+        """
+        Initialize the mention list.
+        
+        Args:
+            mentions: Optional mention dictionaries to load
+        """
+        self._texts: List[str] = []
+        self._starts = array("q")
+        self._ends = array("q")
+        self._scores = array("d")
+        # Keys beyond the core four, per mention; None for the common case of none
+        self._extras: List[Optional[Dict[str, Any]]] = []
+        for mention in mentions or []:
+            self.append(mention)
+    
+    def add(self, text: str, start: int, end: int, score: float) -> None:
+        """Record a mention without building a dictionary."""
+        self._texts.append(text)
+        self._starts.append(start)
+        self._ends.append(end)
+        self._scores.append(score)
+        self._extras.append(None)
+    
+    def append(self, mention: Dict[str, Any]) -> None:
+        """Record a mention given as a dictionary, keeping any extra keys."""
+        self.add(mention["text"], mention["start"], mention["end"], mention.get("score", 0.8))
+        extras = {key: value for key, value in mention.items() if key not in _MENTION_KEYS}
+        if extras:
+            self._extras[-1] = extras
+    
+    def __len__(self) -> int:
+        return len(self._texts)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        mention = {
+            "text": self._texts[index],
+            "start": self._starts[index],
+            "end": self._ends[index],
+            "score": self._scores[index]
+        }
+        extras = self._extras[index]
+        if extras:
+            mention.update(extras)
+        return mention
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (MentionList, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"MentionList({self.to_list()!r})"
+    
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Return the mentions as a list of dictionaries."""
+        return list(self)
+
+
 class Entity:
     """Entity representation with enhanced capabilities."""
     
+    __slots__ = (
+        "entity_id", "name", "entity_type", "description", "aliases",
+        "metadata", "confidence", "mentions", "relationships",
+    )
+    
     def __init__(
         self,
         name: str,
@@ -83,7 +183,7 @@ class Entity:
         self.confidence = confidence
         
         # Track mentions and relationships
-        self.mentions: List[Dict[str, Any]] = []
+        self.mentions = MentionList()
         self.relationships: List[Dict[str, Any]] = []
     
     def to_dict(self) -> Dict[str, Any]:
@@ -96,7 +196,7 @@ class Entity:
             "aliases": self.aliases,
             "metadata": self.metadata,
             "confidence": self.confidence,
-            "mentions": self.mentions,
+            "mentions": self.mentions.to_list(),
             "relationships": self.relationships
         }
     
@@ -112,7 +212,7 @@ class Entity:
             metadata=data.get("metadata", {}),
             confidence=data.get("confidence", 0.7)
         )
-        entity.mentions = data.get("mentions", [])
+        entity.mentions = MentionList(data.get("mentions", []))
         entity.relationships = data.get("relationships", [])
         return entity
     
@@ -126,12 +226,7 @@ class Entity:
             end: End position in text
             score: Confidence score for this mention
         """
-        self.mentions.append({
-            "text": text[start:end],
-            "start": start,
-            "end": end,
-            "score": score
-        })
+        self.mentions.add(text[start:end], start, end, score)
     
     def add_relationship(
         self, 
@@ -162,6 +257,11 @@ class Entity:
 class Relationship:
     """Relationship between entities with enhanced contextual information."""
     
+    __slots__ = (
+        "relationship_id", "source_entity_id", "target_entity_id", "relation_type",
+        "confidence", "bidirectional", "context", "metadata",
+    )
+    
     def __init__(
         self,
         source_entity_id: str,
@@ -232,6 +332,78 @@ class EntityLinker:
     knowledge base integration and semantic matching.
     """
     
+    # Lowercase context indicators for each entity type, used for scoring
+    _CONTEXT_INDICATORS: Dict[str, Tuple[str, ...]] = {
+        EntityType.PERSON: ("who", "he", "she", "born", "died", "wrote", "said"),
+        EntityType.ORGANIZATION: ("organization", "company", "founded", "based", "employees", "team"),
+        EntityType.LOCATION: ("located", "city", "country", "region", "capital", "north", "south", "east", "west"),
+        EntityType.CONCEPT: ("concept", "theory", "idea", "approach", "method", "refers to", "defined as"),
+        EntityType.PRODUCT: ("product", "device", "tool", "software", "released", "launched", "version"),
+    }
+    
+    # Entity type patterns, compiled once for all linkers
+    _ENTITY_PATTERNS: Dict[str, List[Pattern[str]]] = {
+        EntityType.PERSON: [
+            _compile_pattern(r'(?:Mr\.|Mrs\.|Ms\.|Dr\.|Prof\.) [A-Z][a-z]+(?: [A-Z][a-z]+)+'),
+            _compile_pattern(r'[A-Z][a-z]+ [A-Z][a-z]+(?: [A-Z][a-z]+)*'),
+        ],
+        EntityType.ORGANIZATION: [
+            _compile_pattern(r'(?:The |)[A-Z][a-z]+(?: [A-Z][a-z]+)* (?:Corporation|Company|Inc\.|Ltd\.|LLC|GmbH|Foundation|Association|University|Institute)'),
+            _compile_pattern(r'[A-Z]{2,}(?:\s+[A-Z][a-z]+)*'),  # Acronyms like "IBM" or "UNICEF"
+            _compile_pattern(r'[A-Z][a-zA-Z]+'),  # Mixed case company names like OpenAI
+        ],
+        EntityType.LOCATION: [
+            _compile_pattern(r'(?:in |at |from |to )(?:the |)[A-Z][a-z]+(?: [A-Z][a-z]+)*'),
+            _compile_pattern(r'(?:northern|southern|eastern|western|north|south|east|west) [A-Z][a-z]+'),
+        ],
+        EntityType.DATE: [
+            _compile_pattern(r'\d{1,2}/\d{1,2}/\d{2,4}'),
+            _compile_pattern(r'\d{1,2}-\d{1,2}-\d{2,4}'),
+            _compile_pattern(r'(?:January|February|March|April|May|June|July|August|September|October|November|December)(?: \d{1,2})?,? \d{4}'),
+        ],
+        EntityType.CONCEPT: [
+            _compile_pattern(r'(?:concept of |theory of |principle of |idea of |)[A-Z][a-z]+(?: [A-Z][a-z]+)*'),
+        ],
+    }
+    
+    # Contextual relationship patterns, compiled once for all linkers
+    _RELATIONSHIP_PATTERNS: Dict[str, List[Pattern[str]]] = {
+        RelationType.IS_A: [
+            _compile_pattern(r'(?i)(.*) is an? (.*)'),
+            _compile_pattern(r'(?i)(.*) are (?:a type|types) of (.*)'),
+        ],
+        RelationType.PART_OF: [
+            _compile_pattern(r'(?i)(.*) is (?:part|a part) of (.*)'),
+            _compile_pattern(r'(?i)(.*) belongs to (.*)'),
+        ],
+        RelationType.LOCATED_IN: [
+            _compile_pattern(r'(?i)(.*) is (?:located|situated|based) in (.*)'),
+            _compile_pattern(r'(?i)(.*) is headquartered in (.*)'),
+        ],
+        RelationType.CREATED_BY: [
+            _compile_pattern(r'(?i)(.*) (?:created|developed|invented|designed) by (.*)'),
+            _compile_pattern(r'(?i)(.*) is the creator of (.*)'),
+        ],
+        RelationType.WORKS_FOR: [
+            _compile_pattern(r'(?i)(.*) works for (.*)'),
+            _compile_pattern(r'(?i)(.*) is (?:employed|hired) by (.*)'),
+        ],
+        RelationType.CONTRADICTS: [
+            _compile_pattern(r'(?i)(.*) contradicts (.*)'),
+            _compile_pattern(r'(?i)(.*) disagrees with (.*)'),
+        ],
+        RelationType.SUPPORTS: [
+            _compile_pattern(r'(?i)(.*) supports (.*)'),
+            _compile_pattern(r'(?i)(.*) confirms (.*)'),
+        ],
+    }
+    
+    # Context prefixes stripped from matched entity names
+    _NAME_PREFIX_PATTERN = re.compile(r'^(?:in|at|from|to|by|the) ')
+    
+    # Blank-line paragraph separator
+    _PARAGRAPH_BREAK = re.compile(r'\n[ \t]*\n\s*')
+    
     def __init__(self, graphrag_client: Optional[GraphRAGClient] = None):
         """
         Initialize the entity linker.
@@ -241,62 +413,16 @@ class EntityLinker:
         """
         self.graphrag_client = graphrag_client
         
-        # Entity type patterns
-        self._entity_patterns = {
-            EntityType.PERSON: [
-                r'(?:Mr\.|Mrs\.|Ms\.|Dr\.|Prof\.) [A-Z][a-z]+(?: [A-Z][a-z]+)+',
-                r'[A-Z][a-z]+ [A-Z][a-z]+(?: [A-Z][a-z]+)*',
-            ],
-            EntityType.ORGANIZATION: [
-                r'(?:The |)[A-Z][a-z]+(?: [A-Z][a-z]+)* (?:Corporation|Company|Inc\.|Ltd\.|LLC|GmbH|Foundation|Association|University|Institute)',
-                r'[A-Z]{2,}(?:\s+[A-Z][a-z]+)*',  # Acronyms like "IBM" or "UNICEF"
-                r'[A-Z][a-zA-Z]+',  # Mixed case company names like OpenAI
-            ],
-            EntityType.LOCATION: [
-                r'(?:in |at |from |to )(?:the |)[A-Z][a-z]+(?: [A-Z][a-z]+)*',
-                r'(?:northern|southern|eastern|western|north|south|east|west) [A-Z][a-z]+',
-            ],
-            EntityType.DATE: [
-                r'\d{1,2}/\d{1,2}/\d{2,4}',
-                r'\d{1,2}-\d{1,2}-\d{2,4}',
-                r'(?:January|February|March|April|May|June|July|August|September|October|November|December)(?: \d{1,2})?,? \d{4}',
-            ],
-            EntityType.CONCEPT: [
-                r'(?:concept of |theory of |principle of |idea of |)[A-Z][a-z]+(?: [A-Z][a-z]+)*',
-            ],
-        }
+        # Remote extraction configuration: long texts are split into
+        # overlapping chunks that are sent to GraphRAG concurrently
+        self.extract_chunk_size = 8000
+        self.extract_chunk_overlap = 200
+        self.extract_concurrency = 8
         
-        # Contextual relationship patterns
-        self._relationship_patterns = {
-            RelationType.IS_A: [
-                r'(.*) is an? (.*)',
-                r'(.*) are (?:a type|types) of (.*)',
-            ],
-            RelationType.PART_OF: [
-                r'(.*) is (?:part|a part) of (.*)',
-                r'(.*) belongs to (.*)',
-            ],
-            RelationType.LOCATED_IN: [
-                r'(.*) is (?:located|situated|based) in (.*)',
-                r'(.*) is headquartered in (.*)',
-            ],
-            RelationType.CREATED_BY: [
-                r'(.*) (?:created|developed|invented|designed) by (.*)',
-                r'(.*) is the creator of (.*)',
-            ],
-            RelationType.WORKS_FOR: [
-                r'(.*) works for (.*)',
-                r'(.*) is (?:employed|hired) by (.*)',
-            ],
-            RelationType.CONTRADICTS: [
-                r'(.*) contradicts (.*)',
-                r'(.*) disagrees with (.*)',
-            ],
-            RelationType.SUPPORTS: [
-                r'(.*) supports (.*)',
-                r'(.*) confirms (.*)',
-            ],
-        }
+        # LRU cache of GraphRAG sources used for disambiguation, keyed by
+        # entity name. Empty results are cached too.
+        self._disambiguation_cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self.disambiguation_cache_size = 1024
         
         # Entity keyword mapping (well-known entities)
         self._keyword_entity_map = {
@@ -343,6 +469,16 @@ class EntityLinker:
                 'confidence': 0.95
             },
         }
+        
+        # Single-pass scanner over the keyword vocabulary. Longer keywords come
+        # first so the alternation prefers the most specific match.
+        self._keyword_scanner = re.compile("|".join(
+            re.escape(keyword)
+            for keyword in sorted(self._keyword_entity_map, key=len, reverse=True)
+        ))
+        self._keyword_rank = {
+            keyword: rank for rank, keyword in enumerate(self._keyword_entity_map)
+        }
     
     async def extract_entities_from_text(self, text: str, options: Optional[Dict[str, Any]] = None) -> List[Entity]:
         """
@@ -358,7 +494,8 @@ class EntityLinker:
         Returns:
             List of extracted entities
         """
-        if not text:
+        # Blank input never yields entities; skip GraphRAG and local scanning
+        if not text or text.isspace():
             return []
         
         options = options or {}
@@ -369,7 +506,7 @@ class EntityLinker:
         entities = []
         if use_graphrag and self.graphrag_client:
             try:
-                graphrag_entities = await self.graphrag_client.extract_entities(text, options)
+                graphrag_entities = await self._extract_entities_graphrag(text, options)
                 
                 # Convert GraphRAG entities to our format
                 for gent in graphrag_entities:
@@ -395,84 +532,102 @@ class EntityLinker:
         # If GraphRAG failed or wasn't used, fall back to our own implementation
         logger.info("Using local entity extraction")
         
-        # Dictionary to track unique entities
-        entity_map: Dict[str, Entity] = {}
+        # Dictionary to track unique entities. Names whose confidence falls
+        # below the threshold map to None so later matches are still skipped.
+        entity_map: Dict[str, Optional[Entity]] = {}
         
-        # First pass: extract known entities from keyword mapping
+        # First pass: extract known entities from keyword mapping in one scan
         text_lower = text.lower()
-        for keyword, entity_info in self._keyword_entity_map.items():
-            if keyword in text_lower:
-                if keyword not in entity_map:
-                    entity = Entity(
-                        name=entity_info['name'],
-                        entity_type=entity_info['entity_type'],
-                        aliases=entity_info.get('aliases', []),
-                        confidence=entity_info.get('confidence', 0.9)
-                    )
-                    
-                    # Find positions of mentions
-                    start = 0
-                    while True:
-                        pos = text_lower.find(keyword, start)
-                        if pos == -1:
-                            break
-                        
-                        entity.add_mention(text, pos, pos + len(keyword), 0.9)
-                        start = pos + 1
-                    
-                    entity_map[keyword] = entity
+        for match in self._keyword_scanner.finditer(text_lower):
+            keyword = match.group(0)
+            if keyword not in entity_map:
+                entity_info = self._keyword_entity_map[keyword]
+                confidence = entity_info.get('confidence', 0.9)
+                if confidence < min_confidence:
+                    entity_map[keyword] = None
+                    continue
+                
+                entity_map[keyword] = Entity(
+                    name=entity_info['name'],
+                    entity_type=entity_info['entity_type'],
+                    aliases=entity_info.get('aliases', []),
+                    confidence=confidence
+                )
+            
+            entity = entity_map[keyword]
+            if entity is not None:
+                entity.add_mention(text, match.start(), match.end(), 0.9)
+        
+        # The scan finds keywords in text order; put them back in vocabulary
+        # order, since the proximity pass attaches each relationship to the
+        # earlier entity of a pair.
+        entity_map = dict(
+            sorted(entity_map.items(), key=lambda item: self._keyword_rank[item[0]])
+        )
         
-        # Second pass: extract entities based on pattern matching
-        for entity_type, patterns in self._entity_patterns.items():
+        # Second pass: extract entities based on pattern matching. Each distinct
+        # paragraph is scanned once, since a repeated paragraph can only yield
+        # names that are already in the entity map. Matches never span a blank
+        # line, so text split across paragraphs is not joined into one name.
+        paragraphs = self._unique_paragraphs(text)
+        for entity_type, patterns in self._ENTITY_PATTERNS.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, text)
-                for match in matches:
-                    name = match.group(0)
-                    
-                    # Clean up the name (remove context prefixes like "in" or "from")
-                    name = re.sub(r'^(?:in|at|from|to|by|the) ', '', name).strip()
-                    
-                    # Skip if too short
-                    if len(name) < 3:
-                        continue
-                    
-                    # Skip common words that are likely false positives
-                    if name.lower() in {'i', 'me', 'you', 'he', 'she', 'it', 'we', 'they', 
-                                      'monday', 'tuesday', 'wednesday', 'thursday', 
-                                      'friday', 'saturday', 'sunday'}:
-                        continue
-                    
-                    # Skip already added entities
-                    name_lower = name.lower()
-                    if any(name_lower == key.lower() for key in entity_map.keys()):
-                        continue
-                    
-                    # Determine confidence based on match quality
-                    confidence = 0.7  # Base confidence
-                    
-                    # Adjust confidence based on capitalization
-                    if name[0].isupper():
-                        confidence += 0.1
-                    
-                    # Adjust confidence based on context
-                    context_score = self._calculate_context_score(text, match.start(), match.end(), entity_type)
-                    confidence += context_score
-                    
-                    # Create entity
-                    entity = Entity(
-                        name=name,
-                        entity_type=entity_type,
-                        confidence=min(confidence, 0.95)  # Cap at 0.95
-                    )
-                    
-                    # Add mention
-                    entity.add_mention(text, match.start(), match.end(), confidence)
-                    
-                    # Add to map
-                    entity_map[name_lower] = entity
+                for offset, paragraph in paragraphs:
+                    for match in pattern.finditer(paragraph):
+                        name = match.group(0)
+                        
+                        # Clean up the name (remove context prefixes like "in" or "from")
+                        name = self._NAME_PREFIX_PATTERN.sub('', name).strip()
+                        
+                        # Skip if too short
+                        if len(name) < 3:
+                            continue
+                        
+                        # Skip common words that are likely false positives
+                        if name.lower() in {'i', 'me', 'you', 'he', 'she', 'it', 'we', 'they', 
+                                          'monday', 'tuesday', 'wednesday', 'thursday', 
+                                          'friday', 'saturday', 'sunday'}:
+                            continue
+                        
+                        # Skip already added entities (map keys are lowercase)
+                        name_lower = name.lower()
+                        if name_lower in entity_map:
+                            continue
+                        
+                        start = offset + match.start()
+                        end = offset + match.end()
+                        
+                        # Determine confidence based on match quality
+                        confidence = 0.7  # Base confidence
+                        
+                        # Adjust confidence based on capitalization
+                        if name[0].isupper():
+                            confidence += 0.1
+                        
+                        # Adjust confidence based on context
+                        context_score = self._calculate_context_score(text, start, end, entity_type)
+                        confidence += context_score
+                        
+                        # Apply the confidence filter before building the entity
+                        if min(confidence, 0.95) < min_confidence:
+                            entity_map[name_lower] = None
+                            continue
+                        
+                        # Create entity
+                        entity = Entity(
+                            name=name,
+                            entity_type=entity_type,
+                            confidence=min(confidence, 0.95)  # Cap at 0.95
+                        )
+                        
+                        # Add mention
+                        entity.add_mention(text, start, end, confidence)
+                        
+                        # Add to map
+                        entity_map[name_lower] = entity
         
-        # Convert map to list and apply min confidence filter
-        entities = [entity for entity in entity_map.values() if entity.confidence >= min_confidence]
+        # Convert map to list, dropping names filtered by confidence
+        entities = [entity for entity in entity_map.values() if entity is not None]
         
         # Third pass: detect relationships between entities
         if len(entities) >= 2:
@@ -481,6 +636,145 @@ class EntityLinker:
         logger.info(f"Extracted {len(entities)} entities using local implementation")
         return entities
     
+    async def extract_entities_stream(
+        self,
+        text: str,
+        options: Optional[Dict[str, Any]] = None,
+        disambiguate: bool = False
+    ) -> AsyncIterator[Entity]:
+        """
+        Extract entities from text and yield them incrementally.
+        
+        Entities are yielded in descending confidence order. With
+        ``disambiguate`` set, every entity is disambiguated concurrently and
+        yielded as soon as its own lookup completes, so consumers can start
+        on confident entities while GraphRAG lookups are still in flight.
+        
+        Args:
+            text: Text to extract entities from
+            options: Optional extraction options
+            disambiguate: Whether to disambiguate entities before yielding
+            
+        Yields:
+            Extracted (and optionally disambiguated) entities
+        """
+        entities = await self.extract_entities_from_text(text, options)
+        entities.sort(key=lambda entity: entity.confidence, reverse=True)
+        
+        if not disambiguate:
+            for entity in entities:
+                yield entity
+            return
+        
+        tasks = [
+            asyncio.ensure_future(
+                self.disambiguate_entity(entity, self._mention_context(text, entity))
+            )
+            for entity in entities
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def _mention_context(self, text: str, entity: Entity) -> str:
+        """
+        Get the text surrounding an entity's first mention.
+        
+        Args:
+            text: Full text
+            entity: Entity to get context for
+            
+        Returns:
+            Up to 100 characters either side of the first mention, or the
+            entity name if it has no mentions
+        """
+        if not entity.mentions:
+            return entity.name
+        
+        mention = entity.mentions[0]
+        return text[max(0, mention["start"] - 100):mention["end"] + 100]
+    
+    async def _extract_entities_graphrag(self, text: str, options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Extract raw entities with GraphRAG, chunking long texts.
+        
+        Texts up to ``extract_chunk_size`` characters are sent in a single
+        call. Longer texts are split into overlapping chunks which are
+        extracted concurrently (at most ``extract_concurrency`` in flight)
+        and merged by entity ID, or by name when no ID is given.
+        
+        Args:
+            text: Text to extract entities from
+            options: Extraction options passed through to GraphRAG
+            
+        Returns:
+            List of entity dictionaries as returned by GraphRAG
+        """
+        if len(text) <= self.extract_chunk_size:
+            return await self.graphrag_client.extract_entities(text, options)
+        
+        step = self.extract_chunk_size - self.extract_chunk_overlap
+        chunks = [text[i:i + self.extract_chunk_size] for i in range(0, len(text), step)]
+        semaphore = asyncio.Semaphore(self.extract_concurrency)
+        
+        async def extract_chunk(chunk: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.graphrag_client.extract_entities(chunk, options)
+        
+        chunk_results = await asyncio.gather(*(extract_chunk(chunk) for chunk in chunks))
+        
+        # Merge entities reported by more than one chunk
+        merged: Dict[str, Dict[str, Any]] = {}
+        for chunk_entities in chunk_results:
+            for gent in chunk_entities:
+                key = gent.get('entity_id') or gent['name'].lower()
+                existing = merged.get(key)
+                if existing is None:
+                    merged[key] = dict(gent)
+                    continue
+                
+                aliases = list(existing.get('aliases', []))
+                aliases.extend(a for a in gent.get('aliases', []) if a not in aliases)
+                existing['aliases'] = aliases
+                existing['confidence'] = max(
+                    existing.get('confidence', 0.8), gent.get('confidence', 0.8)
+                )
+        
+        logger.debug(f"Merged GraphRAG entities from {len(chunks)} chunks")
+        return list(merged.values())
+    
+    def _unique_paragraphs(self, text: str) -> List[Tuple[int, str]]:
+        """
+        Split text into paragraphs, keeping the first copy of each.
+        
+        Paragraphs are separated by blank lines and compared without
+        surrounding whitespace.
+        
+        Args:
+            text: Full text
+            
+        Returns:
+            List of (offset, paragraph) tuples in text order
+        """
+        paragraphs = []
+        seen: Set[str] = set()
+        start = 0
+        for separator in self._PARAGRAPH_BREAK.finditer(text):
+            paragraphs.append((start, text[start:separator.start()]))
+            start = separator.end()
+        paragraphs.append((start, text[start:]))
+        
+        unique = []
+        for offset, paragraph in paragraphs:
+            key = paragraph.strip()
+            if key and key not in seen:
+                seen.add(key)
+                unique.append((offset, paragraph))
+        return unique
+    
     def _calculate_context_score(self, text: str, start: int, end: int, entity_type: str) -> float:
         """
         Calculate context-based confidence adjustment.
@@ -497,29 +791,20 @@ class EntityLinker:
         # Get context around the entity (up to 50 chars before and after)
         context_start = max(0, start - 50)
         context_end = min(len(text), end + 50)
-        context = text[context_start:context_end]
-        
-        # Define context indicators for each entity type
-        type_indicators = {
-            EntityType.PERSON: ["who", "he", "she", "born", "died", "wrote", "said"],
-            EntityType.ORGANIZATION: ["organization", "company", "founded", "based", "employees", "team"],
-            EntityType.LOCATION: ["located", "city", "country", "region", "capital", "north", "south", "east", "west"],
-            EntityType.CONCEPT: ["concept", "theory", "idea", "approach", "method", "refers to", "defined as"],
-            EntityType.PRODUCT: ["product", "device", "tool", "software", "released", "launched", "version"],
-        }
+        context = text[context_start:context_end].lower()
         
         # Check if context contains indicators for the proposed type
         score = 0.0
-        indicators = type_indicators.get(entity_type, [])
+        indicators = self._CONTEXT_INDICATORS.get(entity_type, ())
         for indicator in indicators:
-            if indicator.lower() in context.lower():
+            if indicator in context:
                 score += 0.05
                 
         # Check if context contains stronger indicators for other types
-        for other_type, other_indicators in type_indicators.items():
+        for other_type, other_indicators in self._CONTEXT_INDICATORS.items():
             if other_type != entity_type:
                 for indicator in other_indicators:
-                    if indicator.lower() in context.lower():
+                    if indicator in context:
                         score -= 0.02
         
         return min(score, 0.2)  # Cap adjustment at 0.2
@@ -533,9 +818,9 @@ class EntityLinker:
             text: Original text
         """
         # First pass: detect relationships based on patterns
-        for pattern_type, patterns in self._relationship_patterns.items():
+        for pattern_type, patterns in self._RELATIONSHIP_PATTERNS.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+                matches = pattern.finditer(text)
                 for match in matches:
                     try:
                         # Extract entity mentions from the pattern match
@@ -572,9 +857,10 @@ class EntityLinker:
         # Second pass: detect relationships based on proximity in text
         # This is a fallback for entities that don't have explicit relationship patterns
         for i, entity1 in enumerate(entities):
+            related_ids = {rel["target_entity_id"] for rel in entity1.relationships}
             for j, entity2 in enumerate(entities[i+1:], i+1):
                 # Skip if already has relationship
-                if any(rel["target_entity_id"] == entity2.entity_id for rel in entity1.relationships):
+                if entity2.entity_id in related_ids:
                     continue
                 
                 # Check if entities are mentioned close to each other
@@ -630,8 +916,15 @@ class EntityLinker:
                 query = f"Tell me about {entity.name}"
                 focus_entities = [entity.name]
                 
-                # Get sources from GraphRAG
-                sources, _ = await self.graphrag_client.get_sources_for_query(query, focus_entities)
+                # Get sources from GraphRAG, reusing earlier lookups for this name
+                sources = self._disambiguation_cache.get(entity.name)
+                if sources is None:
+                    sources, _ = await self.graphrag_client.get_sources_for_query(query, focus_entities)
+                    self._disambiguation_cache[entity.name] = sources
+                    if len(self._disambiguation_cache) > self.disambiguation_cache_size:
+                        self._disambiguation_cache.popitem(last=False)
+                else:
+                    self._disambiguation_cache.move_to_end(entity.name)
                 
                 if sources:
                     # Extract best matching entity from sources
@@ -697,10 +990,22 @@ class EntityLinker:
             }
             nodes.append(node)
         
-        # Create edges
+        # Create edges, skipping dangling endpoints and parallel duplicates
+        entity_ids = {entity.entity_id for entity in entities}
+        seen_edges: Set[Tuple[str, str, str]] = set()
         edges = []
         for entity in entities:
             for relationship in entity.relationships:
+                source_id = relationship["source_entity_id"]
+                target_id = relationship["target_entity_id"]
+                if source_id not in entity_ids or target_id not in entity_ids:
+                    continue
+                
+                edge_key = (source_id, target_id, relationship["relation_type"])
+                if edge_key in seen_edges:
+                    continue
+                seen_edges.add(edge_key)
+                
                 edge = {
                     "id": relationship["relationship_id"],
                     "source": relationship["source_entity_id"],
@@ -8,12 +8,42 @@ allowing agents to use graph-based retrieval-augmented generation capabilities.
 import aiohttp
 import logging
 import json
+import re
+from collections import Counter
 from typing import Dict, List, Any, Optional, Tuple
 import datetime
 import os
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Pattern to find source references like [SOURCE_1]
+_SOURCE_RE = re.compile(r'\[SOURCE_(\d+)\]')
+
+# Connection limits for requests to the GraphRAG MCP server
+MAX_CONNECTIONS_PER_HOST = 4
+KEEPALIVE_TIMEOUT = 30
+
+
+def _json_dumps(payload: Any) -> str:
+    """Serialize a request payload, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(payload)
+
+
+def _json_loads(data: str) -> Any:
+    """Parse a response body, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class GraphRAGClient:
     """Client for the GraphRAG MCP server."""
     
@@ -27,7 +57,40 @@ class GraphRAGClient:
                      or defaults to http://localhost:8083
         """
         self.base_url = base_url or os.environ.get("GRAPHRAG_MCP_URL", "http://localhost:8083")
+        self._client_session: Optional[aiohttp.ClientSession] = None
         logger.info(f"Initialized GraphRAG client with server: {self.base_url}")
+    
+    def _session(self) -> aiohttp.ClientSession:
+        """
+        Return the client's session, creating it on first use.
+        
+        One session and connector serve every request, so connections to the
+        server are kept alive and bounded per host across calls.
+        """
+        if self._client_session is None or self._client_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=MAX_CONNECTIONS_PER_HOST,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                enable_cleanup_closed=True,
+            )
+            self._client_session = aiohttp.ClientSession(
+                connector=connector, json_serialize=_json_dumps
+            )
+        return self._client_session
+    
+    async def close(self) -> None:
+        """Close the client's session and its pooled connections."""
+        if self._client_session is not None:
+            await self._client_session.close()
+            self._client_session = None
+    
+    async def __aenter__(self) -> "GraphRAGClient":
+        """Use the client as an async context manager that closes it on exit."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the client's session."""
+        await self.close()
         
     async def call_tool(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -43,24 +106,24 @@ class GraphRAGClient:
         Raises:
             Exception: If the call fails
         """
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/api/tools/{tool_name}"
-            logger.debug(f"Calling GraphRAG tool: {tool_name} at {url}")
-            
-            try:
-                async with session.post(url, json=params) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Error calling {tool_name}: {error_text}")
-                        raise Exception(f"GraphRAG MCP error: {error_text}")
-                    
-                    return await response.json()
-            except aiohttp.ClientConnectorError as e:
-                logger.error(f"Connection error to GraphRAG MCP server: {e}")
-                raise Exception(f"Could not connect to GraphRAG MCP server at {self.base_url}")
-            except Exception as e:
-                logger.error(f"Error calling {tool_name}: {e}")
-                raise
+        session = self._session()
+        url = f"{self.base_url}/api/tools/{tool_name}"
+        logger.debug(f"Calling GraphRAG tool: {tool_name} at {url}")
+        
+        try:
+            async with session.post(url, json=params) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Error calling {tool_name}: {error_text}")
+                    raise Exception(f"GraphRAG MCP error: {error_text}")
+                
+                return await response.json(loads=_json_loads)
+        except aiohttp.ClientConnectorError as e:
+            logger.error(f"Connection error to GraphRAG MCP server: {e}")
+            raise Exception(f"Could not connect to GraphRAG MCP server at {self.base_url}")
+        except Exception as e:
+            logger.error(f"Error calling {tool_name}: {e}")
+            raise
     
     async def get_server_info(self) -> Dict[str, Any]:
         """
@@ -69,21 +132,21 @@ class GraphRAGClient:
         Returns:
             Server information
         """
-        async with aiohttp.ClientSession() as session:
-            url = f"{self.base_url}/api/info"
-            logger.debug(f"Getting GraphRAG server info from {url}")
-            
-            try:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Error getting server info: {error_text}")
-                        raise Exception(f"GraphRAG MCP error: {error_text}")
-                    
-                    return await response.json()
-            except Exception as e:
-                logger.error(f"Error getting server info: {e}")
-                raise
+        session = self._session()
+        url = f"{self.base_url}/api/info"
+        logger.debug(f"Getting GraphRAG server info from {url}")
+        
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Error getting server info: {error_text}")
+                    raise Exception(f"GraphRAG MCP error: {error_text}")
+                
+                return await response.json(loads=_json_loads)
+        except Exception as e:
+            logger.error(f"Error getting server info: {e}")
+            raise
     
     async def index_source(self, source: Dict[str, Any]) -> str:
         """
@@ -218,20 +281,8 @@ class GraphRAGClient:
         """
         # This functionality is handled on the server side in the GraphRAG service
         # For now, we'll implement a simple version client-side
-        # Extract source references like [SOURCE_1]
-        import re
-        
-        source_pattern = r'\[SOURCE_(\d+)\]'
-        source_refs = re.findall(source_pattern, response)
-        
-        # Count references to each source
-        attribution_counts = {}
-        for ref in source_refs:
-            source_id = int(ref)
-            if source_id in attribution_counts:
-                attribution_counts[source_id] += 1
-            else:
-                attribution_counts[source_id] = 1
+        # Extract and count source references like [SOURCE_1]
+        attribution_counts = dict(Counter(map(int, _SOURCE_RE.findall(response))))
         
         # Map sources
         attributed_sources = []
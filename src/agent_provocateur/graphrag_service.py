@@ -9,8 +9,10 @@ components until the full GraphRAG integration is complete.
 """
 
 import os
+import re
 import logging
 import uuid
+from collections import Counter
 from typing import Any, Dict, List, Optional, Tuple, Union
 import datetime
 
@@ -107,6 +109,9 @@ from agent_provocateur.models import Source, SourceType
 
 logger = logging.getLogger(__name__)
 
+# Pattern to find source references like [SOURCE_1]
+_SOURCE_RE = re.compile(r'\[SOURCE_(\d+)\]')
+
 class GraphRAGService:
     """Service for GraphRAG integration."""
     
@@ -276,22 +281,8 @@ class GraphRAGService:
         Returns:
             Dictionary mapping source IDs to reference counts
         """
-        import re
-        
-        # Pattern to find source references like [SOURCE_1]
-        source_pattern = r'\[SOURCE_(\d+)\]'
-        
-        # Find all source references
-        source_refs = re.findall(source_pattern, response)
-        
         # Count references to each source
-        attribution_counts = {}
-        for ref in source_refs:
-            source_id = int(ref)
-            if source_id in attribution_counts:
-                attribution_counts[source_id] += 1
-            else:
-                attribution_counts[source_id] = 1
+        attribution_counts = dict(Counter(map(int, _SOURCE_RE.findall(response))))
         
         logger.info(f"Extracted {len(attribution_counts)} source attributions from response")
         return attribution_counts
@@ -1,6 +1,8 @@
 import asyncio
 import datetime
+import functools
 import logging
+import os
 import random
 import re
 from typing import Dict, List, Optional
@@ -341,6 +343,9 @@ class McpServer:
     def __init__(self) -> None:
         self.app = FastAPI(title="Mock MCP Server")
         self.config = ServerConfig()
+        # Test runs start without simulated latency
+        if os.environ.get("MCP_TEST_MODE") == "1":
+            self.config = ServerConfig(latency_max_ms=0)
         self.llm_service = LlmService()
         self._setup_routes()
     
@@ -629,4 +634,16 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
-    return server.app
\ No newline at end of file
+    return server.app
+
+
+@functools.lru_cache(maxsize=1)
+def get_app() -> FastAPI:
+    """Return a shared application, created on first use.
+    
+    Unlike create_app, every call returns the same app and server state.
+    
+    Returns:
+        FastAPI: The shared FastAPI application
+    """
+    return create_app()
@@ -14,6 +14,72 @@ from agent_provocateur.goal_refiner import GoalRefiner
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of entities researched at the same time
+MAX_CONCURRENT_ENTITY_RESEARCH = 8
+
+# Maximum number of refined goal tasks executed at the same time
+MAX_CONCURRENT_GOAL_TASKS = 4
+
+
+def _build_search_payload(description: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """For search tasks, use the description as the query."""
+    return {
+        "query": description,
+        "max_results": options.get("max_results", 5)
+    }
+
+
+def _build_research_entity_payload(description: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """For entity research, extract the entity from the description."""
+    # This is a simplified approach - in a real system, you'd use NLP to extract entities
+    words = description.split()
+    if len(words) > 2:
+        # Assume the entity is the last word or phrase
+        return {"entity": words[-1]}
+    return {"entity": description}
+
+
+def _build_xml_task_payload(description: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """For XML-related tasks, pass the document ID and any extraction or validation options."""
+    if "doc_id" not in options:
+        return {}
+    
+    payload = {"doc_id": options["doc_id"]}
+    description = description.lower()
+    
+    # If this is a command extraction task, set the appropriate options
+    if "extract" in description and any(term in description for term in
+                                        ["command", "step", "config", "cisco", "router"]):
+        payload["extract_type"] = "commands"
+        payload["format"] = options.get("format", "text")
+    
+    # If this is a validation task, set validation options
+    elif any(term in description for term in ["validate", "verify", "check"]):
+        payload["validation_level"] = options.get("validation_level", "standard")
+    
+    return payload
+
+
+def _build_validate_xml_payload(description: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """For XML validation, pass the document ID and validation level."""
+    if "doc_id" not in options:
+        return {}
+    return {
+        "doc_id": options["doc_id"],
+        "validation_level": options.get("validation_level", "standard")
+    }
+
+
+# Payload builders by capability, with a priority for tasks listing several
+_PAYLOAD_BUILDERS = {
+    "search": (0, _build_search_payload),
+    "research_entity": (1, _build_research_entity_payload),
+    "extract_entities": (2, _build_xml_task_payload),
+    "parse_xml": (2, _build_xml_task_payload),
+    "analyze_structure": (2, _build_xml_task_payload),
+    "validate_xml": (3, _build_validate_xml_payload),
+}
+
 class ResearchSupervisorAgent(BaseAgent):
     """
     Top-level supervisor for research workflows that coordinates:
@@ -34,6 +100,7 @@ class ResearchSupervisorAgent(BaseAgent):
         super().__init__(agent_id, broker, mcp_url)
         self.workflows = {}
         self.agent_capabilities = {}
+        self._task_intent_index = {}
     
     async def on_startup(self) -> None:
         """Initialize the research supervisor agent."""
@@ -61,7 +128,14 @@ class ResearchSupervisorAgent(BaseAgent):
                     "validate_xml", 
                     "parse_xml",
                     "analyze_structure"
-                ]
+                ],
+                # Intent to send for each capability
+                "intent_map": {
+                    "extract_entities": "extract_entities",
+                    "validate_xml": "validate",
+                    "parse_xml": "parse_document",
+                    "analyze_structure": "analyze_structure"
+                }
             },
             "web_search_agent": {
                 "description": "Performs web searches and retrieves content",
@@ -70,7 +144,13 @@ class ResearchSupervisorAgent(BaseAgent):
                     "fetch_content", 
                     "research_entity",
                     "find_external_sources"
-                ]
+                ],
+                "intent_map": {
+                    "search": "search",
+                    "fetch_content": "fetch_content",
+                    "research_entity": "research_entity",
+                    "find_external_sources": "search"
+                }
             },
             "research_supervisor_agent": {
                 "description": "Coordinates research workflows and synthesizes results",
@@ -79,10 +159,22 @@ class ResearchSupervisorAgent(BaseAgent):
                     "synthesize_research",
                     "process_research",
                     "generate_output"
-                ]
+                ],
+                "intent_map": {
+                    "coordinate_workflow": "research_document",
+                    "synthesize_research": "generate_research_xml",
+                    "process_research": "research_entities"
+                }
             }
         }
         
+        # Index intents by (agent, capability) so task mapping is a single lookup
+        self._task_intent_index = {
+            (agent_id, capability): intent
+            for agent_id, agent_info in self.agent_capabilities.items()
+            for capability, intent in agent_info.get("intent_map", {}).items()
+        }
+        
         self.logger.info(f"Initialized capabilities for {len(self.agent_capabilities)} agent types")
     
     async def handle_research_document(self, task_request: TaskRequest) -> Dict[str, Any]:
@@ -163,14 +255,45 @@ class ResearchSupervisorAgent(BaseAgent):
             # Sort by confidence and take top N
             entities = sorted(entities, key=lambda x: x.get("confidence", 0), reverse=True)[:max_entities]
         
-        research_results = []
+        # Research entities concurrently, bounded so the search backend isn't flooded
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ENTITY_RESEARCH)
+        results = await asyncio.gather(*[
+            self._research_single_entity(entity, use_web_search, search_provider, semaphore)
+            for entity in entities
+        ])
+        research_results = [result for result in results if result is not None]
         
-        # Research each entity
-        for entity in entities:
-            entity_name = entity.get("name")
-            if not entity_name:
-                continue
-                
+        return {
+            "entity_count": len(entities),
+            "researched_count": len(research_results),
+            "research_results": research_results,
+            "used_web_search": use_web_search
+        }
+    
+    async def _research_single_entity(
+        self,
+        entity: Dict[str, Any],
+        use_web_search: bool,
+        search_provider: str,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Research a single entity.
+        
+        Args:
+            entity: Entity information
+            use_web_search: Whether to research via the web search agent
+            search_provider: Search provider for the web search agent
+            semaphore: Semaphore bounding concurrent entity research
+            
+        Returns:
+            Dict with the research result, or None if the entity has no name
+        """
+        entity_name = entity.get("name")
+        if not entity_name:
+            return None
+        
+        async with semaphore:
             self.logger.info(f"Researching entity: {entity_name}")
             
             try:
@@ -193,7 +316,7 @@ class ResearchSupervisorAgent(BaseAgent):
                         entity_result = search_result.output
                         
                         # Create a research result with the web search data
-                        research_result = {
+                        return {
                             "entity": entity_name,
                             "definition": entity_result.get("definition", f"No definition found for {entity_name}"),
                             "confidence": entity_result.get("sources", [{}])[0].get("confidence", 0.7) if entity_result.get("sources") else 0.7,
@@ -202,21 +325,17 @@ class ResearchSupervisorAgent(BaseAgent):
                             "original_context": entity.get("context"),
                             "structured_data": entity_result.get("structured_data")
                         }
-                        
-                        research_results.append(research_result)
-                    else:
-                        # Fall back to mock research if web search fails
-                        self.logger.warning(f"Web search failed for {entity_name}, using mock data")
-                        mock_result = self._generate_mock_research_result(entity)
-                        research_results.append(mock_result)
-                else:
-                    # Use mock research data
-                    mock_result = self._generate_mock_research_result(entity)
-                    research_results.append(mock_result)
+                    
+                    # Fall back to mock research if web search fails
+                    self.logger.warning(f"Web search failed for {entity_name}, using mock data")
+                    return self._generate_mock_research_result(entity)
+                
+                # Use mock research data
+                return self._generate_mock_research_result(entity)
             except Exception as e:
                 self.logger.error(f"Error researching entity {entity_name}: {e}")
                 # Add with error
-                research_results.append({
+                return {
                     "entity": entity_name,
                     "error": str(e),
                     "definition": f"Unable to research {entity_name}",
@@ -224,14 +343,7 @@ class ResearchSupervisorAgent(BaseAgent):
                     "sources": [],
                     "original_xpath": entity.get("xpath"),
                     "original_context": entity.get("context")
-                })
-        
-        return {
-            "entity_count": len(entities),
-            "researched_count": len(research_results),
-            "research_results": research_results,
-            "used_web_search": use_web_search
-        }
+                }
     
     async def handle_generate_research_xml(self, task_request: TaskRequest) -> Dict[str, Any]:
         """
@@ -340,84 +452,20 @@ class ResearchSupervisorAgent(BaseAgent):
             self.workflows[workflow_id]["tasks"] = refined_tasks
             self.workflows[workflow_id]["steps_completed"].append("refine_goal")
             
-            # Step 2: Execute each task in order
-            results = []
-            for task in refined_tasks:
-                task_id = task.get("task_id", str(uuid.uuid4()))
-                description = task.get("description", "")
-                agent_id = task.get("assigned_agent")
-                
-                if not agent_id:
-                    self.logger.warning(f"[{workflow_id}] No agent assigned for task: {description}")
-                    # Try to clarify with user or skip
-                    # For now, we'll use the supervisor as fallback
-                    agent_id = "research_supervisor_agent"
-                
-                self.logger.info(f"[{workflow_id}] Executing task '{description}' with agent {agent_id}")
-                
-                # Map the task to an appropriate intent for the target agent
-                intent = self._map_task_to_intent(task, agent_id)
-                
-                # Create task payload based on task description
-                task_payload = self._create_task_payload(task, options)
-                
-                # Only execute the task if it maps to a known intent
-                if intent:
-                    # If the target is self, handle locally
-                    if agent_id == self.agent_id:
-                        # Create a local task request
-                        local_request = TaskRequest(
-                            task_id=f"{workflow_id}_{task_id}",
-                            source_agent="self",
-                            target_agent=self.agent_id,
-                            intent=intent,
-                            payload=task_payload
-                        )
-                        
-                        # Get the appropriate handler method
-                        handler_name = f"handle_{intent}"
-                        handler = getattr(self, handler_name, None)
-                        
-                        if handler:
-                            task_result = await handler(local_request)
-                        else:
-                            task_result = {
-                                "error": f"No handler found for intent: {intent}",
-                                "status": "failed"
-                            }
-                    else:
-                        # Send to another agent
-                        task_result_obj = await self.send_request_and_wait(
-                            target_agent=agent_id,
-                            intent=intent,
-                            payload=task_payload
-                        )
-                        
-                        if task_result_obj:
-                            task_result = task_result_obj.output
-                        else:
-                            task_result = {
-                                "error": "No response from agent",
-                                "status": "failed"
-                            }
-                    
-                    # Add result
-                    results.append({
-                        "task_id": task_id,
-                        "description": description,
-                        "agent": agent_id,
-                        "intent": intent,
-                        "result": task_result
-                    })
-                else:
-                    # No intent mapping found
-                    results.append({
-                        "task_id": task_id,
-                        "description": description,
-                        "agent": agent_id,
-                        "error": "No intent mapping available for this task",
-                        "status": "skipped"
-                    })
+            # Step 2: Execute the tasks concurrently, bounded so agents aren't flooded;
+            # results keep the task order
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_GOAL_TASKS)
+            pending = [
+                asyncio.ensure_future(self._execute_goal_task(task, options, workflow_id, semaphore))
+                for task in refined_tasks
+            ]
+            try:
+                results = list(await asyncio.gather(*pending))
+            except BaseException:
+                # Don't leave sibling requests running once the workflow has failed
+                for future in pending:
+                    future.cancel()
+                raise
             
             # Update workflow status
             self.workflows[workflow_id]["status"] = "completed"
@@ -442,6 +490,102 @@ class ResearchSupervisorAgent(BaseAgent):
             self.workflows[workflow_id]["error"] = str(e)
             raise
     
+    async def _execute_goal_task(
+        self,
+        task: Dict[str, Any],
+        options: Dict[str, Any],
+        workflow_id: str,
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """
+        Execute a single refined task on its assigned agent.
+        
+        Args:
+            task: The refined task to execute
+            options: Goal options to include in the task payload
+            workflow_id: Workflow tracking ID
+            semaphore: Semaphore bounding concurrent goal tasks
+            
+        Returns:
+            Dict with the task result, or a skipped entry if no intent maps
+        """
+        task_id = task.get("task_id", str(uuid.uuid4()))
+        description = task.get("description", "")
+        agent_id = task.get("assigned_agent")
+        
+        if not agent_id:
+            self.logger.warning(f"[{workflow_id}] No agent assigned for task: {description}")
+            # Try to clarify with user or skip
+            # For now, we'll use the supervisor as fallback
+            agent_id = "research_supervisor_agent"
+        
+        self.logger.info(f"[{workflow_id}] Executing task '{description}' with agent {agent_id}")
+        
+        # Map the task to an appropriate intent for the target agent
+        intent = self._map_task_to_intent(task, agent_id)
+        
+        # Create task payload based on task description
+        task_payload = self._create_task_payload(task, options)
+        
+        # Only execute the task if it maps to a known intent
+        if intent:
+            # Dispatch under the semaphore; it only bounds the agent calls
+            async with semaphore:
+                # If the target is self, handle locally
+                if agent_id == self.agent_id:
+                    # Create a local task request
+                    local_request = TaskRequest(
+                        task_id=f"{workflow_id}_{task_id}",
+                        source_agent="self",
+                        target_agent=self.agent_id,
+                        intent=intent,
+                        payload=task_payload
+                    )
+                    
+                    # Get the appropriate handler method
+                    handler_name = f"handle_{intent}"
+                    handler = getattr(self, handler_name, None)
+                    
+                    if handler:
+                        task_result = await handler(local_request)
+                    else:
+                        task_result = {
+                            "error": f"No handler found for intent: {intent}",
+                            "status": "failed"
+                        }
+                else:
+                    # Send to another agent
+                    task_result_obj = await self.send_request_and_wait(
+                        target_agent=agent_id,
+                        intent=intent,
+                        payload=task_payload
+                    )
+                    
+                    if task_result_obj:
+                        task_result = task_result_obj.output
+                    else:
+                        task_result = {
+                            "error": "No response from agent",
+                            "status": "failed"
+                        }
+            
+            return {
+                "task_id": task_id,
+                "description": description,
+                "agent": agent_id,
+                "intent": intent,
+                "result": task_result
+            }
+        
+        # No intent mapping found
+        return {
+            "task_id": task_id,
+            "description": description,
+            "agent": agent_id,
+            "error": "No intent mapping available for this task",
+            "status": "skipped"
+        }
+    
     def _map_task_to_intent(self, task: Dict[str, Any], agent_id: str) -> Optional[str]:
         """
         Map a task to an appropriate intent for the target agent.
@@ -456,34 +600,11 @@ class ResearchSupervisorAgent(BaseAgent):
         # Get required capabilities for the task
         capabilities = task.get("capabilities", [])
         
-        # Map common capabilities to intents for each agent type
-        capability_to_intent = {
-            "xml_agent": {
-                "extract_entities": "extract_entities",
-                "validate_xml": "validate",
-                "parse_xml": "parse_document",
-                "analyze_structure": "analyze_structure"
-            },
-            "web_search_agent": {
-                "search": "search",
-                "fetch_content": "fetch_content",
-                "research_entity": "research_entity",
-                "find_external_sources": "search"
-            },
-            "research_supervisor_agent": {
-                "coordinate_workflow": "research_document",
-                "synthesize_research": "generate_research_xml",
-                "process_research": "research_entities"
-            }
-        }
-        
-        # Get intent mappings for the target agent
-        agent_intent_map = capability_to_intent.get(agent_id, {})
-        
         # Find the first capability that maps to an intent for this agent
         for capability in capabilities:
-            if capability in agent_intent_map:
-                return agent_intent_map[capability]
+            intent = self._task_intent_index.get((agent_id, capability))
+            if intent:
+                return intent
         
         # If no mapping found but this is a standard task type, use default mappings
         description = task.get("description", "").lower()
@@ -509,56 +630,19 @@ class ResearchSupervisorAgent(BaseAgent):
         Returns:
             The task payload
         """
-        description = task.get("description", "")
-        capabilities = task.get("capabilities", [])
-        
-        # Start with a basic payload including the original task data
+        # Start with a basic payload including the original task data,
+        # letting options from the task itself override the shared ones
         payload = {
             "original_task": task,
-            "options": options
+            "options": {**options, **task.get("options", {})}
         }
         
-        # Add payload details based on the task description and capabilities
-        if "search" in capabilities:
-            # For search tasks, extract the query from the description
-            payload["query"] = description
-            payload["max_results"] = options.get("max_results", 5)
-        
-        elif "research_entity" in capabilities:
-            # For entity research, extract the entity from the description
-            # This is a simplified approach - in a real system, you'd use NLP to extract entities
-            words = description.split()
-            if len(words) > 2:
-                # Assume the entity is the last word or phrase
-                payload["entity"] = words[-1]
-            else:
-                payload["entity"] = description
-        
-        elif "extract_entities" in capabilities or "parse_xml" in capabilities or "analyze_structure" in capabilities:
-            # For XML-related tasks, we need a document ID
-            if "doc_id" in options:
-                payload["doc_id"] = options["doc_id"]
-                
-                # If this is a command extraction task, set the appropriate options
-                if "extract" in description.lower() and any(term in description.lower() for term in 
-                                                          ["command", "step", "config", "cisco", "router"]):
-                    payload["extract_type"] = "commands"
-                    payload["format"] = options.get("format", "text")
-                    
-                # If this is a validation task, set validation options
-                elif any(term in description.lower() for term in ["validate", "verify", "check"]):
-                    payload["validation_level"] = options.get("validation_level", "standard")
-        
-        elif "validate_xml" in capabilities:
-            # For XML validation, we need a document ID
-            if "doc_id" in options:
-                payload["doc_id"] = options["doc_id"]
-                payload["validation_level"] = options.get("validation_level", "standard")
-        
-        # Add any additional options from the task itself
-        task_options = task.get("options", {})
-        if task_options:
-            payload["options"].update(task_options)
+        # Add payload details from the highest-priority capability's builder
+        matches = [_PAYLOAD_BUILDERS[capability] for capability in task.get("capabilities", [])
+                   if capability in _PAYLOAD_BUILDERS]
+        if matches:
+            _, builder = min(matches, key=lambda match: match[0])
+            payload.update(builder(task.get("description", ""), options))
         
         return payload
     
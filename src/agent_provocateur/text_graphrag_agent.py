@@ -46,6 +46,10 @@ class TextGraphRAGAgent(BaseAgent):
         
         self.logger.info(f"Initialized Text GraphRAG agent with server: {graphrag_url}")
     
+    async def on_shutdown(self) -> None:
+        """Close the GraphRAG client's pooled connections."""
+        await self.graphrag_client.close()
+    
     async def handle_index_text_document(self, task_request: TaskRequest) -> Dict[str, Any]:
         """
         Index a text or markdown document in GraphRAG.
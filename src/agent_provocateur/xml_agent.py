@@ -22,6 +22,12 @@ from agent_provocateur.xml_parser import (
 
 logger = logging.getLogger(__name__)
 
+# Source types by their string value, so unknown values fall back without raising
+_SOURCE_TYPES = {source_type.value: source_type for source_type in SourceType}
+
+# Maximum number of nodes verified at the same time in a batch
+MAX_CONCURRENT_NODE_VERIFICATIONS = 8
+
 class XmlAgent(BaseAgent):
     """Agent for XML document analysis and verification planning."""
     
@@ -293,24 +299,58 @@ class XmlAgent(BaseAgent):
                 self.logger.info("Falling back to traditional web search verification")
         
         # Traditional approach with WebSearchAgent
-        completed = 0
-        verification_results = []
-        
         # Check if a WebSearchAgent is available
         web_search_agent = await self.async_mcp_client.find_agent_by_capability("web_search")
         if not web_search_agent:
             self.logger.warning("WebSearchAgent not found for verification. Using local verification.")
         
-        # Process each node
-        for node in nodes:
-            element_name = node.get("element_name", "unknown")
-            content = node.get("content", "")
-            xpath = node.get("xpath", "")
+        # Verify nodes concurrently, bounded so the search agent isn't flooded;
+        # results keep the node order
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_NODE_VERIFICATIONS)
+        results = await asyncio.gather(*[
+            self._verify_node_with_search(node, web_search_agent, options, semaphore)
+            for node in nodes
+        ])
+        verification_results = [result for result in results if result is not None]
+        completed = len(verification_results)
+        
+        return {
+            "doc_id": doc_id,
+            "total_nodes": len(nodes),
+            "completed_nodes": completed,
+            "verification_results": verification_results,
+            "verification_method": "web_search",
+            "options": options
+        }
+        
+    async def _verify_node_with_search(
+        self,
+        node: Dict[str, Any],
+        web_search_agent: Optional[str],
+        options: Dict[str, Any],
+        semaphore: asyncio.Semaphore
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Verify a single node via the web search agent, or a local fallback source.
+        
+        Args:
+            node: Node dict with element_name, content, and xpath
+            web_search_agent: ID of the web search agent, or None to use local verification
+            options: Verification options from the batch request
+            semaphore: Semaphore bounding concurrent node verification
             
-            # Skip empty content
-            if not content or content.strip() == "":
-                continue
-                
+        Returns:
+            Dict with the verification result, or None if the node has no content
+        """
+        element_name = node.get("element_name", "unknown")
+        content = node.get("content", "")
+        xpath = node.get("xpath", "")
+        
+        # Skip empty content
+        if not content or content.strip() == "":
+            return None
+        
+        async with semaphore:
             # Determine confidence threshold based on element type and content
             base_confidence = 0.5
             if element_name.lower() in ["title", "author", "genre"]:
@@ -389,7 +429,7 @@ class XmlAgent(BaseAgent):
                 sources.append(source)
             
             # Record verification result
-            verification_results.append({
+            return {
                 "xpath": xpath,
                 "element_name": element_name,
                 "content": content, 
@@ -397,19 +437,8 @@ class XmlAgent(BaseAgent):
                 "confidence": confidence,
                 "sources": sources,
                 "notes": f"Verification for {element_name} with source attribution"
-            })
-            
-            completed += 1
-        
-        return {
-            "doc_id": doc_id,
-            "total_nodes": len(nodes),
-            "completed_nodes": completed,
-            "verification_results": verification_results,
-            "verification_method": "web_search",
-            "options": options
-        }
-        
+            }
+    
     async def handle_extract_entities(self, task_request: TaskRequest) -> Dict[str, Any]:
         """
         Extract research entities from XML content with real web search attribution.
@@ -1022,12 +1051,8 @@ class XmlAgent(BaseAgent):
                 
             # Handle specific source types
             if "source_type" in source_info and isinstance(source_info["source_type"], str):
-                try:
-                    # Try to convert string to enum value
-                    source_info["source_type"] = SourceType(source_info["source_type"])
-                except ValueError:
-                    # Default to OTHER if invalid
-                    source_info["source_type"] = SourceType.OTHER
+                # Convert string to enum value, defaulting to OTHER if invalid
+                source_info["source_type"] = _SOURCE_TYPES.get(source_info["source_type"], SourceType.OTHER)
                 
             # Add citation if not present
             if "citation" not in source_info and "title" in source_info:
@@ -17,6 +17,9 @@ from agent_provocateur.graphrag_service import GraphRAGService
 
 logger = logging.getLogger(__name__)
 
+# Source types by their string value, so unknown values fall back without raising
+_SOURCE_TYPES = {source_type.value: source_type for source_type in SourceType}
+
 class XmlAttributionService:
     """Service for enhancing XML documents with source attribution."""
     
@@ -123,10 +126,7 @@ class XmlAttributionService:
                 source_id = metadata.get("source_id", f"src_{uuid.uuid4().hex[:8]}")
                 
                 # Determine source type
-                try:
-                    source_type = SourceType(metadata.get("source_type", "other"))
-                except ValueError:
-                    source_type = SourceType.OTHER
+                source_type = _SOURCE_TYPES.get(metadata.get("source_type", "other"), SourceType.OTHER)
                 
                 # Create Source object
                 source = Source(
@@ -29,6 +29,10 @@ class XmlGraphRAGAgent(XmlAgent):
         self.graphrag_client = GraphRAGClient(base_url=graphrag_url)
         self.logger.info(f"Initialized XML GraphRAG agent with server: {graphrag_url}")
     
+    async def on_shutdown(self) -> None:
+        """Close the GraphRAG client's pooled connections."""
+        await self.graphrag_client.close()
+    
     async def handle_extract_entities(self, task_request: TaskRequest) -> Dict[str, Any]:
         """
         Extract research entities from XML content with GraphRAG integration.
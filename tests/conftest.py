@@ -1,8 +1,41 @@
 """Test fixtures for Agent Provocateur."""
 
 import os
+import sys
+import time
+import signal
+import threading
+import subprocess
+import httpx
 import pytest
+import pytest_asyncio
+import requests
+import uvicorn
 from pathlib import Path
+from contextlib import contextmanager
+from fastapi.testclient import TestClient
+from requests.adapters import HTTPAdapter
+
+from agent_provocateur.mcp_server import get_app
+
+# Make the project root importable once for all test modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# MCP servers created by the tests start with zero latency
+os.environ.setdefault("MCP_TEST_MODE", "1")
+
+# Optional faster event loop for the async tests
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+if UVLOOP_AVAILABLE:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
 
 @pytest.fixture
 def xml_test_dir():
@@ -29,4 +62,190 @@ def simple_xml_content(simple_xml_path):
 def complex_xml_content(complex_xml_path):
     """Return the content of the complex test XML file."""
     with open(complex_xml_path, "r", encoding="utf-8") as f:
-        return f.read()
\ No newline at end of file
+        return f.read()
+
+@pytest.fixture(scope="session")
+def entity_test_xml() -> str:
+    """Return the content of the entity test XML file, read once per session."""
+    return (Path(__file__).parent / "test_data" / "xml_documents" / "entity_test.xml").read_text(encoding="utf-8")
+
+# Integration servers are addressed by IP to skip resolving "localhost",
+# which can return ::1 first and stall on an IPv6 connect attempt
+BASE_FRONTEND = "http://127.0.0.1:3001"
+BASE_BACKEND = "http://127.0.0.1:8765"
+
+# Servers found to be down are remembered so later tests skip immediately
+_server_health = {"backend": True, "frontend": True}
+
+def check_server_alive(port, session=requests):
+    """Return whether the server on the given port answers its health check."""
+    try:
+        response = session.get(f"http://127.0.0.1:{port}/api/health", timeout=0.2)
+        return response.status_code == 200
+    except requests.RequestException:
+        return False
+
+@contextmanager
+def run_server(command, cwd, ready_message, port, env=None):
+    """Run a server as a context manager, ensure it's ready, and clean up after."""
+    print(f"Starting server with command: {command} in {cwd}")
+    process = subprocess.Popen(
+        command,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        start_new_session=True  # So we can kill the whole process group
+    )
+    
+    # Probe over one pooled connection, backing off from 20ms up to 200ms
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    
+    # Wait for the ready message or timeout
+    server_ready = False
+    delay = 0.02
+    start_time = time.time()
+    try:
+        while time.time() - start_time < 10:  # 10 second timeout
+            if process.poll() is not None:
+                # Process exited, raise exception with output
+                stdout, stderr = process.communicate()
+                raise Exception(f"Server process exited unexpectedly: {stderr}")
+            
+            # Check if server is responding to requests
+            try:
+                response = session.get(f"http://127.0.0.1:{port}/api/health", timeout=0.2)
+                if response.status_code == 200:
+                    print(f"Server ready at {port}, response: {response.json()}")
+                    server_ready = True
+                    break
+            except requests.RequestException as e:
+                # Server not ready yet, wait a bit
+                print(f"Waiting for server to be ready at port {port}: {str(e)}")
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.2)
+    finally:
+        session.close()
+    
+    if not server_ready:
+        # Kill the process if it's still running
+        os.killpg(process.pid, signal.SIGTERM)
+        stdout, stderr = process.communicate()
+        raise Exception(f"Server failed to start in time: {stderr}")
+    
+    try:
+        yield process
+    finally:
+        # Kill the process group
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            process.wait(timeout=3)
+        except:
+            # If normal termination fails, force kill
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except:
+                pass
+
+@contextmanager
+def run_backend_in_thread(port):
+    """Serve the backend app from a background thread of the test process."""
+    config = uvicorn.Config(
+        "agent_provocateur.mcp_server:create_app",
+        host="127.0.0.1",
+        port=port,
+        factory=True,
+        log_level="warning",
+    )
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    
+    # uvicorn flags the server as started once the socket is listening
+    start_time = time.time()
+    while not server.started:
+        if not thread.is_alive():
+            raise Exception(f"Backend server exited during startup on port {port}")
+        if time.time() - start_time > 10:  # 10 second timeout
+            server.should_exit = True
+            raise Exception(f"Backend server failed to start in time on port {port}")
+        time.sleep(0.01)
+    
+    try:
+        yield server
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+
+@pytest.fixture(scope="session")
+def backend_server():
+    """Start the backend server for testing."""
+    try:
+        with run_backend_in_thread(port=8765) as server:
+            yield server
+    except Exception:
+        _server_health["backend"] = False
+        raise
+
+@pytest.fixture(scope="session")
+def frontend_server(backend_server, tmp_path_factory):
+    """Start the frontend server for testing."""
+    project_root = Path(__file__).parent.parent
+    frontend_dir = project_root / "frontend"
+    
+    # Save uploads to a temporary directory instead of frontend/uploads; pytest cleans old ones up lazily
+    temp_upload_dir = tmp_path_factory.mktemp("uploads")
+    
+    try:
+        with run_server(
+            command=["python", "server.py", "--port", "3001", "--backend-url", BASE_BACKEND],
+            cwd=str(frontend_dir),
+            ready_message="Application startup complete",
+            port=3001,
+            env={**os.environ, "UPLOAD_DIR": str(temp_upload_dir)}
+        ) as process:
+            # Give the server enough time to initialize with the correct backend URL
+            time.sleep(1)
+            yield process
+    except Exception:
+        _server_health["frontend"] = False
+        raise
+
+@pytest.fixture(scope="session")
+def mcp_app():
+    """Return the MCP server app shared across the session."""
+    return get_app()
+
+@pytest.fixture(scope="session")
+def mcp_client(mcp_app):
+    """Return a test client for the shared MCP server app, started once per session."""
+    with TestClient(mcp_app) as client:
+        yield client
+
+@pytest.fixture(scope="session")
+def http():
+    """Return a requests session whose connection pool is shared across the session."""
+    with requests.Session() as s:
+        s.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        yield s
+
+@pytest.fixture
+def live_frontend_server(frontend_server, http):
+    """Skip fast once the frontend server has been seen down."""
+    if not _server_health["frontend"]:
+        pytest.skip("frontend server is down")
+    if frontend_server.poll() is not None or not check_server_alive(3001, http):
+        _server_health["frontend"] = False
+        pytest.fail("frontend server stopped responding")
+    return frontend_server
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client(frontend_server):
+    """Return an async HTTP client pooled across the session for the frontend."""
+    async with httpx.AsyncClient(
+        base_url=BASE_FRONTEND,
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+    ) as client:
+        yield client
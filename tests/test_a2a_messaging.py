@@ -1,14 +1,10 @@
 import asyncio
-import os
-import sys
 import time
 
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from src.agent_provocateur.a2a_messaging import AgentMessaging, InMemoryMessageBroker
-from src.agent_provocateur.a2a_models import Message, MessageType, TaskRequest, TaskStatus
+from agent_provocateur.a2a_messaging import AgentMessaging, InMemoryMessageBroker
+from agent_provocateur.a2a_models import Message, MessageType, TaskRequest, TaskStatus
 
 
 # Define test fixtures
@@ -1,16 +1,12 @@
 import asyncio
-import os
-import sys
 from typing import Any, Dict
 from unittest.mock import MagicMock
 
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from src.agent_provocateur.a2a_messaging import InMemoryMessageBroker
-from src.agent_provocateur.a2a_models import TaskRequest
-from src.agent_provocateur.agent_base import BaseAgent
+from agent_provocateur.a2a_messaging import InMemoryMessageBroker
+from agent_provocateur.a2a_models import TaskRequest
+from agent_provocateur.agent_base import BaseAgent
 
 
 # Define a test agent that implements task handlers
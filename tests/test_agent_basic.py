@@ -1,12 +1,8 @@
 """Basic agent tests without using the full agent-to-agent system."""
 
-import os
-import sys
 from typing import Dict, Any
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from src.agent_provocateur.a2a_models import TaskRequest
+from agent_provocateur.a2a_models import TaskRequest
 
 
 class TestAgentHandlers:
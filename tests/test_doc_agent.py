@@ -10,6 +10,9 @@ from agent_provocateur.agent_implementations import (
     DecisionAgent,
 )
 
+# Document types that also get an LLM analysis after summarization
+_LLM_ANALYZE_TYPES = frozenset({"text", "code"})
+
 
 async def main():
     """Test document agents."""
@@ -29,6 +32,49 @@ async def main():
     for agent in [doc_agent, doc_processing_agent, decision_agent]:
         await agent.start()
     
+    # Pipeline stages: summaries are queued for analysis as they complete
+    async def produce(docs, summary_q):
+        for doc_info in docs:
+            summary = await doc_processing_agent.handle_summarize_document(
+                {"doc_id": doc_info["doc_id"]}
+            )
+            await summary_q.put((doc_info, summary))
+        await summary_q.put(None)
+    
+    async def consume(doc_type, summary_q):
+        while True:
+            item = await summary_q.get()
+            if item is None:
+                break
+            doc_info, summary = item
+            doc_id = doc_info["doc_id"]
+            
+            # Print summary
+            print(f"\n{doc_info['title']} ({doc_id}):")
+            print(f"Summary: {summary.get('summary', 'No summary available')}")
+            
+            # For text and code documents, let's do document analysis with LLM
+            if doc_type in _LLM_ANALYZE_TYPES:
+                # Get full document
+                full_doc = await doc_agent.handle_get_document({"doc_id": doc_id})
+                
+                # Analyze with DecisionAgent
+                analysis = await decision_agent.handle_make_decision({
+                    "decision_type": "document_analysis",
+                    "context": {
+                        "document": full_doc,
+                        "query": "Provide insights on this document",
+                    }
+                })
+                
+                # Print analysis
+                print("\nLLM Analysis:")
+                decision_text = analysis.get("decision", "No analysis available")
+                if len(decision_text) > 300:
+                    print(f"{decision_text[:300]}...")
+                else:
+                    print(decision_text)
+    
     try:
         # List all available documents
         print("\n=== Listing All Documents ===")
@@ -47,37 +93,19 @@ async def main():
                 continue
             
             print(f"\n=== Processing {doc_type.capitalize()} Documents ===")
-            for doc_info in docs_by_type["documents"]:
-                doc_id = doc_info["doc_id"]
-                
-                # Process document
-                summary = await doc_processing_agent.handle_summarize_document({"doc_id": doc_id})
-                
-                # Print summary
-                print(f"\n{doc_info['title']} ({doc_id}):")
-                print(f"Summary: {summary.get('summary', 'No summary available')}")
-                
-                # For text and code documents, let's do document analysis with LLM
-                if doc_type in ["text", "code"]:
-                    # Get full document
-                    full_doc = await doc_agent.handle_get_document({"doc_id": doc_id})
-                    
-                    # Analyze with DecisionAgent
-                    analysis = await decision_agent.handle_make_decision({
-                        "decision_type": "document_analysis",
-                        "context": {
-                            "document": full_doc,
-                            "query": "Provide insights on this document",
-                        }
-                    })
-                    
-                    # Print analysis
-                    print("\nLLM Analysis:")
-                    decision_text = analysis.get("decision", "No analysis available")
-                    if len(decision_text) > 300:
-                        print(f"{decision_text[:300]}...")
-                    else:
-                        print(decision_text)
+            
+            # Summarize the next document while the previous one is analyzed
+            summary_q = asyncio.Queue(maxsize=4)
+            stages = [
+                asyncio.ensure_future(produce(docs_by_type["documents"], summary_q)),
+                asyncio.ensure_future(consume(doc_type, summary_q)),
+            ]
+            try:
+                await asyncio.gather(*stages)
+            finally:
+                # A failed stage would leave the other blocked on the queue
+                for stage in stages:
+                    stage.cancel()
     
     except Exception as e:
         logging.error(f"Error in test: {e}")
@@ -1,6 +1,7 @@
 """Tests for document processing functionality."""
 
 import os
+import re
 import unittest
 import asyncio
 import datetime
@@ -16,6 +17,10 @@ from agent_provocateur.models import (
 
 from agent_provocateur.agent_implementations import DocumentProcessingAgent
 
+# Expected markers in the sample documents, matched in a single pass
+_TEXT_NEEDLES = re.compile(r"Introduction|Features|Conclusion")
+_CODE_NEEDLES = re.compile(r"class ExampleAgent|def handle_message|def main")
+
 
 class TestDocumentProcessing(unittest.TestCase):
     """Test the document processing functionality."""
@@ -90,22 +95,21 @@ class TestDocumentProcessing(unittest.TestCase):
     
     def test_text_document_content(self):
         """Test text document content access."""
-        self.assertTrue("Introduction" in self.text_doc.markdown)
-        self.assertTrue("Features" in self.text_doc.markdown)
-        self.assertTrue("Conclusion" in self.text_doc.markdown)
+        seen = {m.group(0) for m in _TEXT_NEEDLES.finditer(self.text_doc.markdown)}
+        self.assertEqual(seen, {"Introduction", "Features", "Conclusion"})
     
     def test_code_document_content(self):
         """Test code document content access."""
-        self.assertTrue("class ExampleAgent" in self.code_doc.content)
-        self.assertTrue("def handle_message" in self.code_doc.content)
-        self.assertTrue("def main" in self.code_doc.content)
+        seen = {m.group(0) for m in _CODE_NEEDLES.finditer(self.code_doc.content)}
+        self.assertEqual(seen, {"class ExampleAgent", "def handle_message", "def main"})
         self.assertEqual(self.code_doc.language, "python")
     
     def test_json_document_content(self):
         """Test JSON document content access."""
-        self.assertTrue("agent_types" in self.json_doc.data)
-        self.assertTrue("configuration" in self.json_doc.data)
-        self.assertTrue("message_formats" in self.json_doc.data)
+        self.assertLessEqual(
+            {"agent_types", "configuration", "message_formats"},
+            self.json_doc.data.keys(),
+        )
         self.assertEqual(len(self.json_doc.data["agent_types"]), 3)
         self.assertEqual(self.json_doc.data["configuration"]["retry_count"], 3)
     
@@ -182,6 +182,32 @@ class TestEntityLinking:
         
         assert len(all_relationships) > 0
     
+    @pytest.mark.asyncio
+    async def test_extract_entities_local_paragraph_boundary(self):
+        """Test that pattern matches stop at blank lines between paragraphs."""
+        linker = EntityLinker()
+        
+        entities = await linker.extract_entities_from_text("IBM\n\nGoogle")
+        
+        # No "IBM\n\nGoogle" entity spanning the paragraph break
+        assert {entity.name for entity in entities} == {"IBM", "Google"}
+        google = next(entity for entity in entities if entity.name == "Google")
+        assert google.mentions[0]["start"] == 5
+    
+    @pytest.mark.asyncio
+    async def test_extract_entities_local_relationship_direction(self, large_sample_text):
+        """Test that relationships hang off the entity listed first in the vocabulary."""
+        linker = EntityLinker()
+        
+        entities = await linker.extract_entities_from_text(large_sample_text)
+        
+        # Google appears before OpenAI in the text, but OpenAI owns the pair
+        by_name = {entity.name: entity for entity in entities}
+        openai, google = by_name["OpenAI"], by_name["Google"]
+        assert google.entity_id in {r["target_entity_id"] for r in openai.relationships}
+        assert openai.entity_id not in {r["target_entity_id"] for r in google.relationships}
+        assert (len(openai.relationships), len(google.relationships)) == (12, 11)
+        
     @pytest.mark.asyncio
     async def test_extract_entities_graphrag(self, sample_text, mock_graphrag_client):
         """Test extracting entities using GraphRAG client."""
@@ -207,6 +233,47 @@ class TestEntityLinking:
         # Verify mock was called with correct parameters
         mock_graphrag_client.extract_entities.assert_called_once_with(sample_text, {})
     
+    @pytest.mark.asyncio
+    async def test_extract_entities_graphrag_chunked(self, large_sample_text, mock_graphrag_client):
+        """Test that long texts are extracted from GraphRAG in merged chunks."""
+        linker = EntityLinker(mock_graphrag_client)
+        linker.extract_chunk_size = 2000
+        linker.extract_chunk_overlap = 100
+        
+        entities = await linker.extract_entities_from_text(large_sample_text)
+        
+        # Each chunk is sent separately
+        assert mock_graphrag_client.extract_entities.call_count > 1
+        for call in mock_graphrag_client.extract_entities.call_args_list:
+            assert len(call.args[0]) <= linker.extract_chunk_size
+        
+        # Entities repeated across chunks are merged by ID
+        assert sorted(e.entity_id for e in entities) == ["ent_ai123456", "ent_openai12"]
+    
+    @pytest.mark.asyncio
+    async def test_extract_entities_stream(self, sample_text):
+        """Test streaming entities in descending confidence order."""
+        linker = EntityLinker()
+        
+        streamed = [entity async for entity in linker.extract_entities_stream(sample_text)]
+        
+        confidences = [entity.confidence for entity in streamed]
+        assert confidences == sorted(confidences, reverse=True)
+        assert "OpenAI" in {entity.name for entity in streamed}
+    
+    @pytest.mark.asyncio
+    async def test_extract_entities_stream_disambiguate(self, sample_text, empty_results_graphrag_client):
+        """Test streaming entities with concurrent disambiguation."""
+        linker = EntityLinker(empty_results_graphrag_client)
+        expected = await linker.extract_entities_from_text(sample_text)
+        
+        streamed = [
+            entity async for entity in linker.extract_entities_stream(sample_text, disambiguate=True)
+        ]
+        
+        # Every entity is yielded once, whatever order lookups finish in
+        assert sorted(e.name for e in streamed) == sorted(e.name for e in expected)
+    
     @pytest.mark.asyncio
     async def test_disambiguate_entity(self, mock_graphrag_client):
         """Test entity disambiguation with GraphRAG."""
@@ -238,6 +305,25 @@ class TestEntityLinking:
         # Verify mock was called with correct parameters
         mock_graphrag_client.get_sources_for_query.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_disambiguate_entity_cached(self, mock_graphrag_client):
+        """Test that repeated disambiguation of a name reuses GraphRAG sources."""
+        linker = EntityLinker(mock_graphrag_client)
+        
+        first = await linker.disambiguate_entity(
+            Entity(name="OpenAI", entity_type=EntityType.ORGANIZATION, confidence=0.7),
+            "OpenAI is a leading AI research company."
+        )
+        second = await linker.disambiguate_entity(
+            Entity(name="OpenAI", entity_type=EntityType.ORGANIZATION, confidence=0.7),
+            "OpenAI released ChatGPT."
+        )
+        
+        # Only the first call reaches GraphRAG
+        mock_graphrag_client.get_sources_for_query.assert_called_once()
+        assert first.metadata["disambiguation_score"] == second.metadata["disambiguation_score"]
+        assert first.entity_id != second.entity_id
+    
     @pytest.mark.asyncio
     async def test_create_entity_map(self):
         """Test creating entity map for visualization."""
@@ -299,6 +385,24 @@ class TestEntityLinking:
             assert "label" in edge
             assert "type" in edge
     
+    @pytest.mark.asyncio
+    async def test_create_entity_map_skips_dangling_and_duplicate_edges(self):
+        """Test that entity map edges only connect known entities once."""
+        entity1 = Entity(name="Google", entity_type=EntityType.ORGANIZATION, entity_id="entity_g")
+        entity2 = Entity(name="Geoffrey Hinton", entity_type=EntityType.PERSON, entity_id="entity_h")
+        
+        entity2.add_relationship(entity1.entity_id, RelationType.WORKS_FOR)
+        entity2.add_relationship(entity1.entity_id, RelationType.WORKS_FOR)
+        entity2.add_relationship("entity_missing", RelationType.RELATED_TO)
+        
+        linker = EntityLinker()
+        entity_map = await linker.create_entity_map([entity1, entity2])
+        
+        assert len(entity_map["nodes"]) == 2
+        assert len(entity_map["edges"]) == 1
+        assert entity_map["edges"][0]["source"] == "entity_h"
+        assert entity_map["edges"][0]["target"] == "entity_g"
+    
     def test_singleton_instance(self, mock_graphrag_client):
         """Test the singleton pattern for entity linker."""
         # Get instance with client
@@ -395,6 +499,37 @@ class TestEntity:
         assert entity.mentions[0]["end"] == 21
         assert entity.mentions[0]["score"] == 0.9
     
+    def test_mentions_round_trip(self):
+        """Test that mentions serialize as plain dictionaries."""
+        entity = Entity(name="OpenAI", entity_type=EntityType.ORGANIZATION)
+        entity.add_mention("OpenAI and OpenAI", 0, 6, 0.9)
+        entity.add_mention("OpenAI and OpenAI", 11, 17, 0.8)
+        
+        mentions = entity.to_dict()["mentions"]
+        assert mentions == [
+            {"text": "OpenAI", "start": 0, "end": 6, "score": 0.9},
+            {"text": "OpenAI", "start": 11, "end": 17, "score": 0.8},
+        ]
+        assert json.loads(json.dumps(mentions)) == mentions
+        
+        restored = Entity.from_dict(entity.to_dict())
+        assert restored.mentions == entity.mentions
+        assert restored.mentions[-1]["start"] == 11
+    
+    def test_mentions_round_trip_extra_keys(self):
+        """Test that mention keys beyond text/start/end/score survive a round trip."""
+        entity_dict = {
+            "name": "OpenAI",
+            "entity_type": EntityType.ORGANIZATION,
+            "mentions": [
+                {"text": "OpenAI", "start": 0, "end": 6, "score": 0.9, "source": "doc1"},
+                {"text": "OpenAI", "start": 11, "end": 17, "score": 0.8},
+            ]
+        }
+        
+        restored = Entity.from_dict(Entity.from_dict(entity_dict).to_dict())
+        assert restored.to_dict()["mentions"] == entity_dict["mentions"]
+    
     def test_add_relationship(self):
         """Test adding relationship to entity."""
         entity = Entity(
@@ -525,6 +660,14 @@ class TestErrorHandling:
         entities = await linker.extract_entities_from_text("   \n   \t   ")
         assert entities == []
     
+    @pytest.mark.asyncio
+    async def test_blank_text_skips_graphrag(self, mock_graphrag_client):
+        """Test that blank input does not reach the GraphRAG client."""
+        linker = EntityLinker(mock_graphrag_client)
+        
+        assert await linker.extract_entities_from_text("   \n   \t   ") == []
+        mock_graphrag_client.extract_entities.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_empty_graphrag_results(self, sample_text, empty_results_graphrag_client):
         """Test handling of empty results from GraphRAG client."""
@@ -1,177 +1,102 @@
 """Integration tests for frontend and backend interaction."""
 
-import os
-import sys
-import time
+import asyncio
 import pytest
-import tempfile
-import shutil
-import subprocess
-import requests
-import signal
-from pathlib import Path
-from contextlib import contextmanager
-
-
-@contextmanager
-def run_server(command, cwd, ready_message, port):
-    """Run a server as a context manager, ensure it's ready, and clean up after."""
-    print(f"Starting server with command: {command} in {cwd}")
-    process = subprocess.Popen(
-        command,
-        cwd=cwd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        universal_newlines=True,
-        shell=True,
-        preexec_fn=os.setsid  # So we can kill the whole process group
-    )
-    
-    # Wait for the ready message or timeout
-    server_ready = False
-    start_time = time.time()
-    while time.time() - start_time < 10:  # 10 second timeout
-        if process.poll() is not None:
-            # Process exited, raise exception with output
-            stdout, stderr = process.communicate()
-            raise Exception(f"Server process exited unexpectedly: {stderr}")
-        
-        # Check if server is responding to requests
-        try:
-            response = requests.get(f"http://localhost:{port}/api/health", timeout=0.5)
-            if response.status_code == 200:
-                print(f"Server ready at {port}, response: {response.json()}")
-                server_ready = True
-                break
-        except requests.RequestException as e:
-            # Server not ready yet, wait a bit
-            print(f"Waiting for server to be ready at port {port}: {str(e)}")
-            time.sleep(0.5)
-    
-    if not server_ready:
-        # Kill the process if it's still running
-        os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-        stdout, stderr = process.communicate()
-        raise Exception(f"Server failed to start in time: {stderr}")
-    
-    try:
-        yield process
-    finally:
-        # Kill the process group
-        try:
-            os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-            process.wait(timeout=3)
-        except:
-            # If normal termination fails, force kill
-            try:
-                os.killpg(os.getpgid(process.pid), signal.SIGKILL)
-            except:
-                pass
-
-
-@pytest.fixture(scope="module")
-def backend_server():
-    """Start the backend server for testing."""
-    project_root = Path(__file__).parent.parent
-    with run_server(
-        command="python -m agent_provocateur.main --no-metrics --port 8765",
-        cwd=str(project_root),
-        ready_message="Application startup complete",
-        port=8765
-    ) as process:
-        yield process
-
-
-@pytest.fixture(scope="module")
-def frontend_server(backend_server):
-    """Start the frontend server for testing."""
-    project_root = Path(__file__).parent.parent
-    frontend_dir = project_root / "frontend"
+import pytest_asyncio
+from io import BytesIO
+
+
+async def probe_many(client, paths):
+    """GET independent paths concurrently over one pooled client.
     
-    # Create temporary upload directory
-    temp_upload_dir = tempfile.mkdtemp()
+    Returns a dict mapping each path to its response, or to the exception
+    raised while fetching it, so callers can assert on each probe separately.
+    """
+    responses = await asyncio.gather(
+        *(client.get(path) for path in paths), return_exceptions=True
+    )
+    return dict(zip(paths, responses))
+
+
+def check_health(data):
+    """Check the frontend health check payload."""
+    assert data["status"] == "ok"
+    # We just check that the backend_url exists, not the specific value
+    # This avoids issues with environment configuration differences
+    assert "backend_url" in data
+
+
+def check_info(data):
+    """Check that backend availability is reported through the frontend."""
+    assert "backend_status" in data
+    # The backend might be reported as unavailable depending on the test environment
+    # We just check that the status is reported, not its specific value
+    assert data["backend_status"] is not None
+
+
+def check_documents(documents):
+    """Check documents fetched from the backend through the frontend proxy."""
+    assert isinstance(documents, list)
     
-    try:
-        with run_server(
-            command=f"python server.py --port 3001 --backend-url http://localhost:8765",
-            cwd=str(frontend_dir),
-            ready_message="Application startup complete",
-            port=3001
-        ) as process:
-            # Ensure upload directory exists
-            os.makedirs(Path(frontend_dir) / "uploads", exist_ok=True)
-            # Give the server enough time to initialize with the correct backend URL
-            time.sleep(1)
-            yield process
-    finally:
-        # Clean up temp directory
-        shutil.rmtree(temp_upload_dir)
+    # There might not be documents in the test environment
+    # If there are documents, verify their structure
+    if len(documents) > 0:
+        doc = documents[0]
+        assert "doc_id" in doc
+        assert "title" in doc
+        assert "doc_type" in doc
+
+
+# Independent read-only probes, fetched together and asserted individually
+PROBES = {
+    "/api/health": check_health,
+    "/api/info": check_info,
+    "/api/documents": check_documents,
+}
 
 
 @pytest.fixture
-def xml_file_path(xml_test_dir):
-    """Return the path to a test XML file."""
-    return xml_test_dir / "simple.xml"
+def xml_file_bytes(xml_test_dir):
+    """Return the bytes of a test XML file, read outside the event loop."""
+    return (xml_test_dir / "simple.xml").read_bytes()
 
 
+@pytest_asyncio.fixture(scope="class")
+async def snapshot(http_client):
+    """Fetch all read-only probe endpoints concurrently, once per test class.
+    
+    Their responses don't change within a server lifetime; tests that mutate
+    state (such as uploads) must issue their own fresh requests.
+    """
+    return await probe_many(http_client, list(PROBES))
+
+
+@pytest.mark.usefixtures("live_frontend_server")
 class TestFrontendBackendIntegration:
-    """Integration tests for frontend and backend."""
+    """Integration tests for frontend and backend.
     
-    def test_frontend_health_check(self, frontend_server):
-        """Test frontend health check."""
-        response = requests.get("http://localhost:3001/api/health")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "ok"
-        # We just check that the backend_url exists, not the specific value
-        # This avoids issues with environment configuration differences
-        assert "backend_url" in data
+    The backend_server and frontend_server fixtures live in conftest.py and are
+    shared by every integration module in the session.
+    """
     
-    def test_backend_via_frontend_health(self, frontend_server):
-        """Test backend availability through frontend health check."""
-        response = requests.get("http://localhost:3001/api/info")
+    @pytest.mark.parametrize("path", list(PROBES))
+    async def test_frontend_probe(self, snapshot, path):
+        """Test the frontend health, info and document list endpoints."""
+        response = snapshot[path]
+        if isinstance(response, Exception):
+            raise response
         assert response.status_code == 200
         data = response.json()
-        print(f"API info response: {data}")
-        assert "backend_status" in data
-        # The backend might be reported as unavailable depending on the test environment
-        # We just check that the status is reported, not its specific value
-        assert data["backend_status"] is not None
-    
-    def test_fetch_documents_through_frontend(self, frontend_server):
-        """Test fetching documents from backend through frontend proxy."""
-        response = requests.get("http://localhost:3001/api/documents")
-        assert response.status_code == 200
-        documents = response.json()
-        print(f"Documents response: {documents}")
-        assert isinstance(documents, list)
-        
-        # There might not be documents in the test environment
-        # If there are documents, verify their structure
-        if len(documents) > 0:
-            doc = documents[0]
-            assert "doc_id" in doc
-            assert "title" in doc
-            assert "doc_type" in doc
+        print(f"{path} response: {data}")
+        PROBES[path](data)
     
-    def test_upload_document_end_to_end(self, frontend_server, xml_file_path):
+    async def test_upload_document_end_to_end(self, http_client, xml_file_bytes):
         """Test uploading a document through the frontend to the backend."""
-        # Prepare the multipart form data
-        with open(xml_file_path, "rb") as f:
-            xml_content = f.read()
-        
-        files = {
-            "file": ("test.xml", xml_content, "application/xml")
-        }
-        data = {
-            "title": "Integration Test Document"
-        }
-        
-        # Upload the document
-        upload_response = requests.post(
-            "http://localhost:3001/documents/upload",
-            files=files,
-            data=data
+        # Upload the document from memory so no blocking file I/O runs on the event loop
+        upload_response = await http_client.post(
+            "/documents/upload",
+            files={"file": ("test.xml", BytesIO(xml_file_bytes), "application/xml")},
+            data={"title": "Integration Test Document"}
         )
         assert upload_response.status_code == 200
         upload_result = upload_response.json()
@@ -182,7 +107,7 @@ class TestFrontendBackendIntegration:
         doc_id = upload_result["doc_id"]
         
         # Check the document list to see if our document is there
-        list_response = requests.get("http://localhost:3001/api/documents")
+        list_response = await http_client.get("/api/documents")
         assert list_response.status_code == 200
         documents = list_response.json()
         print(f"Documents after upload: {documents}")
@@ -200,14 +125,14 @@ class TestFrontendBackendIntegration:
             assert uploaded_doc["title"] == "Integration Test Document"
             assert uploaded_doc["doc_type"] == "xml"
     
-    def test_fallback_when_backend_unavailable(self, frontend_server):
+    async def test_fallback_when_backend_unavailable(self, http_client):
         """Test frontend fallback behavior when backend is unavailable."""
         # This test would normally involve stopping the backend
         # Since we don't want to disturb the other tests, we'll simulate by calling
         # a non-existent backend endpoint
         
         # Use an endpoint that doesn't exist to force a backend error
-        response = requests.get("http://localhost:3001/api/nonexistent")
+        response = await http_client.get("/api/nonexistent")
         
         # We expect a 404 but not a 500, showing frontend handled the backend error
         assert response.status_code == 404
@@ -1,6 +1,7 @@
 """Tests for the GoalRefiner component."""
 
 import asyncio
+import functools
 import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -11,6 +12,12 @@ from agent_provocateur.a2a_models import TaskRequest, TaskStatus
 from agent_provocateur.mcp_client import McpClient
 
 
+@functools.lru_cache(maxsize=1)
+def _make_mock_client():
+    """Build the spec'd MCP client mock once; introspecting McpClient is not free."""
+    return AsyncMock(spec=McpClient)
+
+
 class TestGoalRefiner:
     """Tests for the GoalRefiner class."""
     
@@ -47,7 +54,9 @@ class TestGoalRefiner:
     @pytest.fixture
     def mock_mcp_client(self):
         """Mock MCP client for testing."""
-        client = AsyncMock(spec=McpClient)
+        # Reuse the cached mock, clearing call history and configured results
+        client = _make_mock_client()
+        client.reset_mock(return_value=True, side_effect=True)
         
         # Mock the generate_text method
         mock_response = MagicMock()
@@ -77,7 +86,6 @@ class TestGoalRefiner:
         """GoalRefiner instance for testing."""
         return GoalRefiner(agent_capabilities, mock_mcp_client)
     
-    @pytest.mark.asyncio
     async def test_refine_goal(self, goal_refiner, mock_mcp_client):
         """Test the refine_goal method with LLM integration."""
         # Test with a sample goal
@@ -101,7 +109,6 @@ class TestGoalRefiner:
         assert refined_tasks[1]["description"] == "Extract entities from document ABC123"
         assert "extract_entities" in refined_tasks[1]["capabilities"]
     
-    @pytest.mark.asyncio
     async def test_map_tasks_to_agents(self, goal_refiner):
         """Test mapping tasks to agents based on capabilities."""
         # Test with sample tasks
@@ -137,27 +144,26 @@ class TestGoalRefiner:
         assert mapped_tasks[1]["assigned_agent"] == "xml_agent"
         assert mapped_tasks[2]["assigned_agent"] == "research_supervisor_agent"
         
-    @pytest.mark.asyncio
-    async def test_find_matching_agent(self, goal_refiner):
+    @pytest.mark.parametrize("caps,expected", [
+        (["search"], "web_search_agent"),
+        (["extract_entities"], "xml_agent"),
+        (["coordinate_workflow"], "research_supervisor_agent"),
+        # Unknown or empty capabilities fall back to the supervisor
+        (["unknown_capability"], "research_supervisor_agent"),
+        ([], "research_supervisor_agent"),
+    ])
+    async def test_find_matching_agent(self, goal_refiner, caps, expected):
         """Test finding the most suitable agent for a set of capabilities."""
-        # Test with various capability combinations
-        assert goal_refiner._find_matching_agent(["search"]) == "web_search_agent"
-        assert goal_refiner._find_matching_agent(["extract_entities"]) == "xml_agent"
-        assert goal_refiner._find_matching_agent(["coordinate_workflow"]) == "research_supervisor_agent"
-        
-        # Test with mixed capabilities - the implementation should find the agent with the most matches
+        assert goal_refiner._find_matching_agent(caps) == expected
+    
+    async def test_find_matching_agent_mixed(self, goal_refiner):
+        """Test finding an agent for mixed capabilities."""
+        # The implementation should find the agent with the most matches
         # Since our implementation prioritizes the first matching capability, we need to adjust our expectation
         # The actual result depends on the implementation in _find_matching_agent
         mixed_result = goal_refiner._find_matching_agent(["search", "extract_entities"]) 
         assert mixed_result in ["web_search_agent", "xml_agent"]
-        
-        # Test with unknown capability
-        assert goal_refiner._find_matching_agent(["unknown_capability"]) == "research_supervisor_agent"
-        
-        # Test with empty capabilities
-        assert goal_refiner._find_matching_agent([]) == "research_supervisor_agent"
     
-    @pytest.mark.asyncio
     async def test_generate_fallback_tasks(self, goal_refiner):
         """Test the fallback task generation when LLM is not available."""
         # Test with a sample goal
@@ -173,7 +179,6 @@ class TestGoalRefiner:
         assert "search" in fallback_tasks[0]["capabilities"]
         assert "analyze" in fallback_tasks[0]["capabilities"]
         
-    @pytest.mark.asyncio
     async def test_prompt_for_clarification(self, goal_refiner, mock_mcp_client):
         """Test generating a clarification question for an ambiguous task."""
         # Set up the mock response
@@ -3,10 +3,7 @@ Tests for GraphRAG client integration.
 """
 
 import pytest
-import aiohttp
-import asyncio
-from unittest.mock import patch, Mock
-import json
+from aioresponses import aioresponses
 
 from agent_provocateur.graphrag_client import GraphRAGClient
 
@@ -19,60 +16,53 @@ signed in 2015, aims to limit global warming to well below 2°C.
 """
 
 @pytest.fixture
-def mock_response():
-    """Create a mock aiohttp response."""
-    mock = Mock()
-    mock.status = 200
-    mock.json = Mock(return_value=asyncio.Future())
-    mock.json.return_value.set_result({})
-    mock.__aenter__ = Mock(return_value=mock)
-    mock.__aexit__ = Mock(return_value=None)
-    return mock
+def mock_aiohttp():
+    """Intercept aiohttp requests at the transport layer."""
+    with aioresponses() as mocked:
+        yield mocked
 
 @pytest.fixture
-def mock_session(mock_response):
-    """Create a mock aiohttp ClientSession."""
-    mock = Mock()
-    mock.post = Mock(return_value=mock_response)
-    mock.get = Mock(return_value=mock_response)
-    mock.__aenter__ = Mock(return_value=mock)
-    mock.__aexit__ = Mock(return_value=None)
-    return mock
+async def client():
+    """GraphRAG client for the test server, closed after the test."""
+    async with GraphRAGClient(base_url="http://test-server") as client:
+        yield client
 
-@pytest.mark.asyncio
-async def test_call_tool(mock_session, mock_response):
+async def test_call_tool(mock_aiohttp, client):
     """Test calling a tool on the GraphRAG MCP server."""
-    with patch('aiohttp.ClientSession', return_value=mock_session):
-        client = GraphRAGClient(base_url="http://test-server")
-        
-        # Configure mock response
-        mock_response.json.return_value = asyncio.Future()
-        mock_response.json.return_value.set_result({
-            "success": True,
-            "test": "value"
-        })
-        
-        # Call the tool
-        result = await client.call_tool("test_tool", {"param": "value"})
-        
-        # Verify the call
-        mock_session.post.assert_called_once_with(
-            "http://test-server/api/tools/test_tool",
-            json={"param": "value"}
-        )
-        
-        assert result["success"] is True
-        assert result["test"] == "value"
+    mock_aiohttp.post(
+        "http://test-server/api/tools/test_tool",
+        payload={"success": True, "test": "value"}
+    )
+    
+    # Call the tool
+    result = await client.call_tool("test_tool", {"param": "value"})
+    
+    # Verify the call
+    mock_aiohttp.assert_called_once_with(
+        "http://test-server/api/tools/test_tool",
+        method="POST",
+        json={"param": "value"}
+    )
+    
+    assert result["success"] is True
+    assert result["test"] == "value"
 
-@pytest.mark.asyncio
-async def test_extract_entities(mock_session, mock_response):
+async def test_call_tool_error_status(mock_aiohttp, client):
+    """Test that a non-200 response raises an error."""
+    mock_aiohttp.post(
+        "http://test-server/api/tools/test_tool",
+        status=500,
+        body="internal error"
+    )
+    
+    with pytest.raises(Exception, match="GraphRAG MCP error: internal error"):
+        await client.call_tool("test_tool", {"param": "value"})
+
+async def test_extract_entities(mock_aiohttp, client):
     """Test extracting entities from text."""
-    with patch('aiohttp.ClientSession', return_value=mock_session):
-        client = GraphRAGClient(base_url="http://test-server")
-        
-        # Configure mock response
-        mock_response.json.return_value = asyncio.Future()
-        mock_response.json.return_value.set_result({
+    mock_aiohttp.post(
+        "http://test-server/api/tools/graphrag_extract_entities",
+        payload={
             "success": True,
             "entities": [
                 {
@@ -88,31 +78,29 @@ async def test_extract_entities(mock_session, mock_response):
                     "confidence": 0.9
                 }
             ]
-        })
-        
-        # Extract entities
-        entities = await client.extract_entities(SAMPLE_TEXT)
-        
-        # Verify the call
-        mock_session.post.assert_called_once_with(
-            "http://test-server/api/tools/graphrag_extract_entities",
-            json={"text": SAMPLE_TEXT, "options": {}}
-        )
-        
-        assert len(entities) == 2
-        assert entities[0]["entity_id"] == "ent_123"
-        assert entities[0]["name"] == "Climate change"
-        assert entities[1]["entity_type"] == "organization"
+        }
+    )
+    
+    # Extract entities
+    entities = await client.extract_entities(SAMPLE_TEXT)
+    
+    # Verify the call
+    mock_aiohttp.assert_called_once_with(
+        "http://test-server/api/tools/graphrag_extract_entities",
+        method="POST",
+        json={"text": SAMPLE_TEXT, "options": {}}
+    )
+    
+    assert len(entities) == 2
+    assert entities[0]["entity_id"] == "ent_123"
+    assert entities[0]["name"] == "Climate change"
+    assert entities[1]["entity_type"] == "organization"
 
-@pytest.mark.asyncio
-async def test_get_sources_for_query(mock_session, mock_response):
+async def test_get_sources_for_query(mock_aiohttp, client):
     """Test getting sources for a query."""
-    with patch('aiohttp.ClientSession', return_value=mock_session):
-        client = GraphRAGClient(base_url="http://test-server")
-        
-        # Configure mock response
-        mock_response.json.return_value = asyncio.Future()
-        mock_response.json.return_value.set_result({
+    mock_aiohttp.post(
+        "http://test-server/api/tools/graphrag_query",
+        payload={
             "success": True,
             "sources": [
                 {
@@ -126,33 +114,33 @@ async def test_get_sources_for_query(mock_session, mock_response):
                 }
             ],
             "attributed_prompt": "Answer based on these sources: [SOURCE_1]..."
-        })
-        
-        # Get sources
-        sources, prompt = await client.get_sources_for_query(
-            "What are the effects of climate change?",
-            focus_entities=["ent_123"]
-        )
-        
-        # Verify the call
-        mock_session.post.assert_called_once_with(
-            "http://test-server/api/tools/graphrag_query",
-            json={
-                "query": "What are the effects of climate change?",
-                "focus_entities": ["ent_123"],
-                "options": {}
-            }
-        )
-        
-        assert len(sources) == 1
-        assert sources[0]["metadata"]["source_id"] == "src_123"
-        assert sources[0]["relevance_score"] == 0.95
-        assert "Answer based on these sources" in prompt
+        }
+    )
+    
+    # Get sources
+    sources, prompt = await client.get_sources_for_query(
+        "What are the effects of climate change?",
+        focus_entities=["ent_123"]
+    )
+    
+    # Verify the call
+    mock_aiohttp.assert_called_once_with(
+        "http://test-server/api/tools/graphrag_query",
+        method="POST",
+        json={
+            "query": "What are the effects of climate change?",
+            "focus_entities": ["ent_123"],
+            "options": {}
+        }
+    )
+    
+    assert len(sources) == 1
+    assert sources[0]["metadata"]["source_id"] == "src_123"
+    assert sources[0]["relevance_score"] == 0.95
+    assert "Answer based on these sources" in prompt
 
-@pytest.mark.asyncio
-async def test_process_attributed_response():
+async def test_process_attributed_response(client):
     """Test processing an attributed response."""
-    client = GraphRAGClient(base_url="http://test-server")
     
     # Sample response and sources
     response = "Climate change is a serious issue [SOURCE_1]. The Paris Agreement was signed in 2015 [SOURCE_2]."
@@ -186,4 +174,17 @@ async def test_process_attributed_response():
     assert result["sources"][0]["reference_count"] == 1
     assert result["sources"][1]["source_id"] == "src_456"
     assert result["sources"][1]["reference_count"] == 1
-    assert 0.7 < result["confidence"] < 0.95  # Should be between the source confidence values
\ No newline at end of file
+    assert 0.7 < result["confidence"] < 0.95  # Should be between the source confidence values
+
+async def test_session_reused_until_closed(mock_aiohttp, client):
+    """Test that calls share one pooled session and close() releases it."""
+    mock_aiohttp.get("http://test-server/api/info", payload={"name": "graphrag"}, repeat=True)
+    
+    await client.get_server_info()
+    session = client._session()
+    await client.get_server_info()
+    assert client._session() is session
+    
+    await client.close()
+    assert session.closed
+    assert client._client_session is None
@@ -1,31 +1,48 @@
-import os
 import sys
 
 import pytest
-from fastapi.testclient import TestClient
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from agent_provocateur.mcp_server import ServerConfig
+from agent_provocateur.models import JiraTicket, SearchResults
 
-from src.agent_provocateur.mcp_server import create_app
-from src.agent_provocateur.models import JiraTicket, SearchResults
 
+# Config the server starts with in test mode (MCP_TEST_MODE, set in conftest.py)
+ZERO_LATENCY_CONFIG = {"latency_min_ms": 0, "latency_max_ms": 0, "error_rate": 0.0}
 
+
+@pytest.fixture
+def client(mcp_client):
+    """Test client for the MCP server shared by the session."""
+    return mcp_client
+
+
+@pytest.fixture(scope="module")
+def default_config(mcp_client):
+    """Return the config the server started with, before any test changed it."""
+    return mcp_client.get("/config").json()
+
+
+# Every test shares one server whose /config they change; --dist=loadfile (pyproject addopts)
+# already runs this whole module on one xdist worker, so they never race
 @pytest.fixture
-def client():
-    """Test client for the MCP server."""
-    app = create_app()
-    return TestClient(app)
+def restore_config(client, default_config):
+    """Put the shared server back on its starting config after the test."""
+    yield
+    client.post("/config", json=default_config)
 
 
-def test_server_config(client):
+def test_server_config(client, restore_config):
     """Test server configuration endpoint."""
-    # Get default config
+    # Check default config
+    config = ServerConfig()
+    assert config.latency_min_ms == 0
+    assert config.latency_max_ms == 500
+    assert config.error_rate == 0.0
+    
+    # Get current config, which test mode starts at zero latency
     response = client.get("/config")
     assert response.status_code == 200
-    config = response.json()
-    assert config["latency_min_ms"] == 0
-    assert config["latency_max_ms"] == 500
-    assert config["error_rate"] == 0.0
+    assert response.json() == ZERO_LATENCY_CONFIG
     
     # Update config
     new_config = {
@@ -43,9 +60,6 @@ def test_server_config(client):
 
 def test_fetch_ticket(client):
     """Test fetching a JIRA ticket."""
-    # Set zero latency for tests
-    client.post("/config", json={"latency_min_ms": 0, "latency_max_ms": 0})
-    
     # Test valid ticket
     response = client.get("/jira/ticket/AP-1")
     assert response.status_code == 200
@@ -60,9 +74,6 @@ def test_fetch_ticket(client):
 
 def test_search_web(client):
     """Test web search."""
-    # Set zero latency for tests
-    client.post("/config", json={"latency_min_ms": 0, "latency_max_ms": 0})
-    
     # Test search with results
     response = client.get("/search", params={"query": "agent protocol"})
     assert response.status_code == 200
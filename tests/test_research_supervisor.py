@@ -1,6 +1,5 @@
 """Tests for the Research Supervisor Agent."""
 
-import os
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -11,89 +10,77 @@ from agent_provocateur.models import Document, XmlDocument
 from agent_provocateur.research_supervisor_agent import ResearchSupervisorAgent
 
 
-@pytest.fixture
-def entity_test_xml() -> str:
-    """Load entity test XML file."""
-    test_file = os.path.join(
-        os.path.dirname(__file__),
-        "test_data/xml_documents/entity_test.xml"
-    )
-    with open(test_file, "r") as f:
-        return f.read()
+@pytest.fixture(scope="module")
+def broker():
+    """Return a message broker shared by the module's agents."""
+    return InMemoryMessageBroker()
 
 
 @pytest.fixture
-def mock_xml_document():
-    """Create a mock XML document."""
-    return XmlDocument(
-        doc_id="xml1",
-        doc_type="xml",
-        title="Test XML Document",
-        content="<root><entity>Test Entity</entity></root>",
-        root_element="root",
-        created_at="2024-01-01T00:00:00",
-        updated_at="2024-01-01T00:00:00",
-        namespaces={},
-        researchable_nodes=[]
-    )
+def agent(broker):
+    """Return a fresh research supervisor agent on the shared broker."""
+    agent = ResearchSupervisorAgent("test_supervisor", broker)
+    yield agent
+    agent.workflows.clear()
 
 
-@pytest.mark.asyncio
-async def test_detect_document_type_xml(mock_xml_document):
-    """Test detecting XML document type."""
-    # Create mock client
+XML_DOCUMENT = XmlDocument(
+    doc_id="xml1",
+    doc_type="xml",
+    title="Test XML Document",
+    content="<root><entity>Test Entity</entity></root>",
+    root_element="root",
+    created_at="2024-01-01T00:00:00",
+    updated_at="2024-01-01T00:00:00",
+    namespaces={},
+    researchable_nodes=[]
+)
+
+TEXT_DOCUMENT = Document(
+    doc_id="text1",
+    doc_type="text",
+    title="Test Text Document",
+    created_at="2024-01-01T00:00:00",
+    updated_at="2024-01-01T00:00:00",
+    metadata={}
+)
+
+
+@pytest.fixture(params=[
+    (XML_DOCUMENT, {
+        "is_xml": True,
+        "needs_verification": True,
+        "needs_research": True,
+        "detected_type": "xml"
+    }),
+    (TEXT_DOCUMENT, {"is_xml": False, "detected_type": "text"}),
+], ids=["xml", "non_xml"])
+def doc_case(request):
+    """Return a mock client serving one document, the expected detection, and the doc ID."""
+    doc, expected = request.param
     mock_client = AsyncMock()
-    mock_client.get_document = AsyncMock(return_value=mock_xml_document)
-    
-    # Create agent
-    broker = InMemoryMessageBroker()
-    agent = ResearchSupervisorAgent("test_supervisor", broker)
-    agent.async_mcp_client = mock_client
-    
-    # Test document type detection
-    result = await agent.detect_document_type("xml1")
-    
-    # Verify results
-    assert result["doc_id"] == "xml1"
-    assert result["is_xml"] is True
-    assert result["needs_verification"] is True
-    assert result["needs_research"] is True
-    assert result["detected_type"] == "xml"
+    mock_client.get_document = AsyncMock(return_value=doc)
+    return mock_client, expected, doc.doc_id
 
 
 @pytest.mark.asyncio
-async def test_detect_document_type_non_xml():
-    """Test detecting non-XML document type."""
-    # Create mock document
-    text_doc = Document(
-        doc_id="text1",
-        doc_type="text",
-        title="Test Text Document",
-        created_at="2024-01-01T00:00:00",
-        updated_at="2024-01-01T00:00:00",
-        metadata={}
-    )
-    
-    # Create mock client
-    mock_client = AsyncMock()
-    mock_client.get_document = AsyncMock(return_value=text_doc)
-    
-    # Create agent
-    broker = InMemoryMessageBroker()
-    agent = ResearchSupervisorAgent("test_supervisor", broker)
+async def test_detect_document_type(agent, doc_case):
+    """Test detecting XML and non-XML document types."""
+    mock_client, expected, doc_id = doc_case
     agent.async_mcp_client = mock_client
     
     # Test document type detection
-    result = await agent.detect_document_type("text1")
+    result = await agent.detect_document_type(doc_id)
     
     # Verify results
-    assert result["doc_id"] == "text1"
-    assert result["is_xml"] is False
-    assert result["detected_type"] == "text"
+    assert result["doc_id"] == doc_id
+    for key, value in expected.items():
+        assert result[key] == value
+        assert type(result[key]) is type(value)
 
 
 @pytest.mark.asyncio
-async def test_research_entities():
+async def test_research_entities(agent):
     """Test entity research."""
     # Create test entities
     entities = [
@@ -111,10 +98,6 @@ async def test_research_entities():
         }
     ]
     
-    # Create agent
-    broker = InMemoryMessageBroker()
-    agent = ResearchSupervisorAgent("test_supervisor", broker)
-    
     # Create task request
     task_request = TaskRequest(
         task_id="test_task",
@@ -133,16 +116,17 @@ async def test_research_entities():
     
     research_results = result["research_results"]
     assert len(research_results) == 2
+    by_entity = {r["entity"]: r for r in research_results}
     
     # Check first entity result
-    gpt_result = next((r for r in research_results if r["entity"] == "ChatGPT"), None)
+    gpt_result = by_entity.get("ChatGPT")
     assert gpt_result is not None
     assert "definition" in gpt_result
     assert "confidence" in gpt_result
     assert len(gpt_result["sources"]) > 0
     
     # Check second entity result
-    nlp_result = next((r for r in research_results if r["entity"] == "Natural Language Processing"), None)
+    nlp_result = by_entity.get("Natural Language Processing")
     assert nlp_result is not None
     assert "definition" in nlp_result
     assert "confidence" in nlp_result
@@ -150,15 +134,11 @@ async def test_research_entities():
 
 
 @pytest.mark.asyncio
-async def test_generate_research_xml(entity_test_xml):
+async def test_generate_research_xml(agent, entity_test_xml):
     """Test generating enriched XML with research results."""
     # Create mock client
     mock_client = AsyncMock()
     mock_client.get_xml_content = AsyncMock(return_value=entity_test_xml)
-    
-    # Create agent
-    broker = InMemoryMessageBroker()
-    agent = ResearchSupervisorAgent("test_supervisor", broker)
     agent.async_mcp_client = mock_client
     
     # Create research results
@@ -216,22 +196,22 @@ async def test_generate_research_xml(entity_test_xml):
     assert result["validation"]["valid"] is True
 
 
-@pytest.mark.asyncio
-async def test_research_document_workflow():
-    """Test the complete document research workflow for XML documents."""
-    # Create a mock broker that simulates the messaging system
-    mock_broker = MagicMock()
-    
-    # Configure mock task results
-    detect_result = {
+@pytest.fixture(scope="module")
+def detect_result():
+    """Return the document type detection result for an XML document."""
+    return {
         "doc_id": "xml1",
         "is_xml": True,
         "needs_verification": True,
         "needs_research": True,
         "detected_type": "xml"
     }
-    
-    entity_result = {
+
+
+@pytest.fixture(scope="module")
+def entity_result():
+    """Return the entity extraction result for an XML document."""
+    return {
         "doc_id": "xml1",
         "entity_count": 2,
         "entities": [
@@ -249,22 +229,36 @@ async def test_research_document_workflow():
             }
         ]
     }
+
+
+@pytest.fixture(scope="module")
+def task_results(entity_result):
+    """Return mock task results keyed by the intent they answer."""
+    # Other intents get None and are handled by the real methods
+    return {
+        "extract_entities": MagicMock(output=entity_result)
+    }
+
+
+class RecordingSender:
+    """Stand-in for send_request_and_wait that records calls in a plain list."""
     
-    # Create a mock send_request_and_wait method
-    async def mock_send_request(*args, **kwargs):
-        intent = kwargs.get("intent")
-        if intent == "extract_entities":
-            result = MagicMock()
-            result.output = entity_result
-            return result
-        # Other intents will be handled by the real methods
-        return None
+    def __init__(self, results):
+        self.results = results
+        self.calls = []
     
-    # Create agent with mock broker and methods
-    agent = ResearchSupervisorAgent("test_supervisor", mock_broker)
+    async def send(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.results.get(kwargs["intent"])
+
+
+@pytest.mark.asyncio
+async def test_research_document_workflow(agent, detect_result, task_results):
+    """Test the complete document research workflow for XML documents."""
+    recording = RecordingSender(task_results)
     
     # Mock methods
-    agent.send_request_and_wait = AsyncMock(side_effect=mock_send_request)
+    agent.send_request_and_wait = recording.send
     agent.detect_document_type = AsyncMock(return_value=detect_result)
     
     # Create a task request
@@ -290,11 +284,11 @@ async def test_research_document_workflow():
     agent.detect_document_type.assert_called_once_with("xml1")
     
     # Verify the send_request_and_wait was called to extract entities
-    agent.send_request_and_wait.assert_any_call(
-        target_agent="xml_agent",
-        intent="extract_entities",
-        payload={"doc_id": "xml1", "options": {}}
-    )
+    assert {
+        "target_agent": "xml_agent",
+        "intent": "extract_entities",
+        "payload": {"doc_id": "xml1", "options": {}}
+    } in recording.calls
     
     # Verify workflow tracking
     workflow_id = result["workflow_id"]
@@ -5,26 +5,29 @@ import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from agent_provocateur.research_supervisor_agent import ResearchSupervisorAgent
+from agent_provocateur.research_supervisor_agent import ResearchSupervisorAgent, MAX_CONCURRENT_GOAL_TASKS
 from agent_provocateur.goal_refiner import GoalRefiner
 from agent_provocateur.a2a_models import TaskRequest, TaskStatus, TaskResult
 from agent_provocateur.a2a_messaging import InMemoryMessageBroker
 
 
+@pytest.fixture(scope="module")
+async def initialized_agent():
+    """ResearchSupervisorAgent started once, so capabilities are built a single time."""
+    broker = InMemoryMessageBroker()
+    agent = ResearchSupervisorAgent("research_supervisor_agent", broker)
+    await agent.on_startup()
+    return agent
+
+
 class TestSupervisorGoalProcessing:
     """Tests for the goal processing functionality in ResearchSupervisorAgent."""
     
     @pytest.fixture
-    def mock_broker(self):
-        """Mock message broker for testing."""
-        broker = InMemoryMessageBroker()
-        return broker
-    
-    @pytest.fixture
-    def supervisor_agent(self, mock_broker):
-        """ResearchSupervisorAgent instance for testing."""
-        agent = ResearchSupervisorAgent("research_supervisor_agent", mock_broker)
-        return agent
+    def supervisor_agent(self, initialized_agent):
+        """Shared ResearchSupervisorAgent with no workflows left over from other tests."""
+        initialized_agent.workflows.clear()
+        return initialized_agent
     
     @pytest.mark.asyncio
     async def test_initialize_agent_capabilities(self, supervisor_agent):
@@ -45,9 +48,6 @@ class TestSupervisorGoalProcessing:
     @pytest.mark.asyncio
     async def test_map_task_to_intent(self, supervisor_agent):
         """Test mapping tasks to intents for various agent types."""
-        # Initialize agent capabilities first
-        await supervisor_agent._initialize_agent_capabilities()
-        
         # Test with different task and agent combinations
         
         # XML agent tasks
@@ -88,9 +88,6 @@ class TestSupervisorGoalProcessing:
     @pytest.mark.asyncio
     async def test_create_task_payload(self, supervisor_agent):
         """Test creating task payloads based on task descriptions and capabilities."""
-        # Initialize agent capabilities first
-        await supervisor_agent._initialize_agent_capabilities()
-        
         # Options to include in all payloads
         options = {"max_results": 10, "doc_id": "doc123"}
         
@@ -130,11 +127,8 @@ class TestSupervisorGoalProcessing:
         assert options_payload["options"]["max_results"] == 5  # Task option overrides global option
         
     @pytest.mark.asyncio
-    async def test_handle_process_goal(self, supervisor_agent):
+    async def test_handle_process_goal(self, supervisor_agent, monkeypatch):
         """Test the handle_process_goal method."""
-        # Initialize the agent
-        await supervisor_agent.on_startup()
-        
         # Mock the goal refiner's refine_goal method
         mock_tasks = [
             {
@@ -150,7 +144,7 @@ class TestSupervisorGoalProcessing:
                 "assigned_agent": "xml_agent"
             }
         ]
-        supervisor_agent.goal_refiner.refine_goal = AsyncMock(return_value=mock_tasks)
+        monkeypatch.setattr(supervisor_agent.goal_refiner, "refine_goal", AsyncMock(return_value=mock_tasks))
         
         # Mock the send_request_and_wait method
         mock_result = TaskResult(
@@ -160,7 +154,7 @@ class TestSupervisorGoalProcessing:
             target_agent="research_supervisor_agent",
             output={"query": "machine learning", "results": [{"title": "ML Article"}]}
         )
-        supervisor_agent.send_request_and_wait = AsyncMock(return_value=mock_result)
+        monkeypatch.setattr(supervisor_agent, "send_request_and_wait", AsyncMock(return_value=mock_result))
         
         # Create a task request
         task_request = TaskRequest(
@@ -194,4 +188,83 @@ class TestSupervisorGoalProcessing:
         assert result["goal"] == "Research machine learning and extract entities"
         assert result["task_count"] == 2
         assert result["status"] == "completed"
-        assert len(result["results"]) == 2
\ No newline at end of file
+        assert len(result["results"]) == 2
+    
+    @staticmethod
+    def _search_tasks(count):
+        """Return refined search tasks for the web search agent."""
+        return [
+            {
+                "task_id": f"task{i}",
+                "description": f"Search for topic {i}",
+                "capabilities": ["search"],
+                "assigned_agent": "web_search_agent"
+            }
+            for i in range(count)
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_handle_process_goal_bounds_concurrency(self, supervisor_agent, monkeypatch):
+        """Test that goal tasks run concurrently, but no more than the cap at once."""
+        tasks = self._search_tasks(MAX_CONCURRENT_GOAL_TASKS * 2)
+        monkeypatch.setattr(supervisor_agent.goal_refiner, "refine_goal", AsyncMock(return_value=tasks))
+        
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def send(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(output={"status": "completed"})
+        
+        monkeypatch.setattr(supervisor_agent, "send_request_and_wait", send)
+        
+        task_request = TaskRequest(
+            task_id="test_goal",
+            source_agent="test",
+            target_agent="research_supervisor_agent",
+            intent="process_goal",
+            payload={"goal": "Research many topics"}
+        )
+        result = await supervisor_agent.handle_process_goal(task_request)
+        
+        assert result["task_count"] == len(tasks)
+        assert max_in_flight == MAX_CONCURRENT_GOAL_TASKS
+    
+    @pytest.mark.asyncio
+    async def test_handle_process_goal_cancels_siblings_on_failure(self, supervisor_agent, monkeypatch):
+        """Test that a failing task cancels the goal's other in-flight tasks."""
+        tasks = self._search_tasks(3)
+        monkeypatch.setattr(supervisor_agent.goal_refiner, "refine_goal", AsyncMock(return_value=tasks))
+        
+        cancelled = []
+        
+        async def send(**kwargs):
+            if kwargs["payload"]["query"] == "Search for topic 0":
+                raise RuntimeError("agent failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(kwargs["payload"]["query"])
+                raise
+        
+        monkeypatch.setattr(supervisor_agent, "send_request_and_wait", send)
+        
+        task_request = TaskRequest(
+            task_id="test_goal",
+            source_agent="test",
+            target_agent="research_supervisor_agent",
+            intent="process_goal",
+            payload={"goal": "Research three topics"}
+        )
+        with pytest.raises(RuntimeError, match="agent failed"):
+            await supervisor_agent.handle_process_goal(task_request)
+        
+        # Let the cancellations land, then check no sibling was left running
+        await asyncio.sleep(0)
+        assert sorted(cancelled) == ["Search for topic 1", "Search for topic 2"]
+        workflow = next(iter(supervisor_agent.workflows.values()))
+        assert workflow["status"] == "failed"
@@ -1,22 +1,16 @@
 """Tests for the Text GraphRAG agent with markdown and text document support."""
 
-import os
-import asyncio
+import copy
+import types
 import pytest
-import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 from agent_provocateur.text_graphrag_agent import TextGraphRAGAgent
-from agent_provocateur.a2a_models import TaskRequest, TaskResult, TaskStatus
-from agent_provocateur.graphrag_client import GraphRAGClient
+from agent_provocateur.a2a_models import TaskRequest
 from agent_provocateur.entity_linking import Entity, EntityType, RelationType
-from agent_provocateur.models import Document, DocumentContent
 
 
-@pytest.fixture
-def sample_markdown():
-    """Sample markdown content for testing."""
-    return """# Artificial Intelligence and Climate Change
+SAMPLE_MARKDOWN = """# Artificial Intelligence and Climate Change
 
 ## Introduction
 
@@ -38,31 +32,51 @@ is an international treaty addressing this issue. The United States rejoined the
 """
 
 
+@pytest.fixture(scope="module")
+def sample_markdown():
+    """Sample markdown content for testing; strings are immutable, so one is shared."""
+    return SAMPLE_MARKDOWN
+
+
+# Entities returned by the mock GraphRAG client
+GRAPHRAG_ENTITIES = [
+    {
+        "name": "Artificial Intelligence",
+        "entity_type": "concept",
+        "entity_id": "ent_ai123456",
+        "description": "The simulation of human intelligence in machines",
+        "aliases": ["AI", "machine intelligence"],
+        "confidence": 0.9,
+        "metadata": {"source": "graphrag"}
+    },
+    {
+        "name": "Climate Change",
+        "entity_type": "concept",
+        "entity_id": "ent_cc789012",
+        "description": "Long-term change in Earth's climate patterns",
+        "confidence": 0.85,
+        "metadata": {"source": "graphrag"}
+    }
+]
+
+
+@pytest.fixture(scope="module")
+def _graphrag_client_mock():
+    """Build the GraphRAG client mock once, with only the methods the agent calls."""
+    client = AsyncMock()
+    client.extract_entities = AsyncMock()
+    client.index_text_document = AsyncMock()
+    return client
+
+
 @pytest.fixture
-def mock_graphrag_client():
-    """Create a mock GraphRAG client."""
-    client = AsyncMock(spec=GraphRAGClient)
+def mock_graphrag_client(_graphrag_client_mock):
+    """Return the shared GraphRAG client mock with calls and results reset."""
+    client = _graphrag_client_mock
+    client.reset_mock(return_value=True, side_effect=True)
     
     # Setup mock extract_entities method
-    client.extract_entities.return_value = [
-        {
-            "name": "Artificial Intelligence",
-            "entity_type": "concept",
-            "entity_id": "ent_ai123456",
-            "description": "The simulation of human intelligence in machines",
-            "aliases": ["AI", "machine intelligence"],
-            "confidence": 0.9,
-            "metadata": {"source": "graphrag"}
-        },
-        {
-            "name": "Climate Change",
-            "entity_type": "concept",
-            "entity_id": "ent_cc789012",
-            "description": "Long-term change in Earth's climate patterns",
-            "confidence": 0.85,
-            "metadata": {"source": "graphrag"}
-        }
-    ]
+    client.extract_entities.return_value = copy.deepcopy(GRAPHRAG_ENTITIES)
     
     # Setup mock index_text_document method
     client.index_text_document.return_value = "doc_markdown_123"
@@ -70,15 +84,29 @@ def mock_graphrag_client():
     return client
 
 
-@pytest.fixture
-def text_graphrag_agent():
-    """Create a Text GraphRAG agent for testing."""
+@pytest.fixture(scope="module")
+def _base_agent():
+    """Create the Text GraphRAG agent once, with its initial attributes."""
     # Create agent with mocked dependencies
     agent = TextGraphRAGAgent("test_text_graphrag_agent")
     
-    # Mock messaging
-    agent.messaging = MagicMock()
-    agent.messaging.send_task_result = MagicMock()
+    # No-op messaging; no test asserts on sent results
+    agent.messaging = types.SimpleNamespace(send_task_result=lambda *args, **kwargs: None)
+    
+    return agent, dict(vars(agent))
+
+
+@pytest.fixture
+def text_graphrag_agent(_base_agent):
+    """Return the shared Text GraphRAG agent restored to its initial state."""
+    agent, initial_state = _base_agent
+    
+    # Drop attributes earlier tests set, and give containers fresh copies
+    vars(agent).clear()
+    vars(agent).update({
+        name: copy.copy(value) if isinstance(value, (dict, list, set)) else value
+        for name, value in initial_state.items()
+    })
     
     return agent
 
@@ -173,19 +201,13 @@ async def test_extract_entities(text_graphrag_agent, mock_graphrag_client, sampl
     assert result["extraction_method"] == "graphrag_mcp"
     
     # Verify entity details
-    entity_names = [entity["name"] for entity in result["entities"]]
-    assert "Artificial Intelligence" in entity_names
-    assert "Climate Change" in entity_names
+    entity_names = {entity["name"] for entity in result["entities"]}
+    assert {"Artificial Intelligence", "Climate Change"} <= entity_names
 
 
-@pytest.mark.asyncio
-async def test_extract_enhanced_entities(text_graphrag_agent, sample_markdown):
-    """Test enhanced entity extraction with relationships."""
-    # Create entity linker mock
-    entity_linker = AsyncMock()
-    text_graphrag_agent.entity_linker = entity_linker
-    
-    # Create sample entities for mocking
+@pytest.fixture(scope="module")
+def _ai_cc_oa_entities():
+    """Entities (AI, Climate Change, OpenAI) with relationships, built once per module."""
     entities = [
         Entity(
             name="Artificial Intelligence",
@@ -218,6 +240,95 @@ async def test_extract_enhanced_entities(text_graphrag_agent, sample_markdown):
         relation_type=RelationType.CREATED_BY
     )
     
+    return entities
+
+
+@pytest.fixture(scope="module")
+def _ai_ml_oa_entities():
+    """Entities (AI, Machine Learning, OpenAI) with relationships, built once per module."""
+    entities = [
+        Entity(
+            name="Artificial Intelligence",
+            entity_type=EntityType.CONCEPT,
+            entity_id="entity_ai123",
+            confidence=0.9
+        ),
+        Entity(
+            name="Machine Learning",
+            entity_type=EntityType.CONCEPT,
+            entity_id="entity_ml456",
+            confidence=0.85
+        ),
+        Entity(
+            name="OpenAI",
+            entity_type=EntityType.ORGANIZATION,
+            entity_id="entity_oa789",
+            confidence=0.8
+        )
+    ]
+    
+    # Add relationships
+    entities[0].add_relationship(
+        target_entity_id=entities[1].entity_id,
+        relation_type=RelationType.HAS_PART
+    )
+    entities[2].add_relationship(
+        target_entity_id=entities[0].entity_id,
+        relation_type=RelationType.RELATED_TO
+    )
+    
+    return entities
+
+
+@pytest.fixture(scope="module")
+def _ai_ml_oa_entity_map(_ai_ml_oa_entities):
+    """Map entity ID to entity for the AI, Machine Learning, OpenAI entities."""
+    return {entity.entity_id: entity for entity in _ai_ml_oa_entities}
+
+
+@pytest.fixture(scope="module")
+def _ai_ml_cc_entity_map():
+    """Map entity ID to entity for AI, Machine Learning, Climate Change, built once per module."""
+    entities = [
+        Entity(
+            name="Artificial Intelligence",
+            entity_type=EntityType.CONCEPT,
+            entity_id="entity_ai123",
+            confidence=0.9
+        ),
+        Entity(
+            name="Machine Learning",
+            entity_type=EntityType.CONCEPT,
+            entity_id="entity_ml456",
+            confidence=0.85
+        ),
+        Entity(
+            name="Climate Change",
+            entity_type=EntityType.CONCEPT,
+            entity_id="entity_cc789",
+            confidence=0.8
+        )
+    ]
+    
+    # Add relationships
+    entities[0].add_relationship(
+        target_entity_id=entities[1].entity_id,
+        relation_type=RelationType.HAS_PART
+    )
+    
+    return {entity.entity_id: entity for entity in entities}
+
+
+@pytest.mark.asyncio
+async def test_extract_enhanced_entities(text_graphrag_agent, sample_markdown, _ai_cc_oa_entities):
+    """Test enhanced entity extraction with relationships."""
+    # Create entity linker mock
+    entity_linker = AsyncMock()
+    text_graphrag_agent.entity_linker = entity_linker
+    
+    # Copy the shared entities, since the handler may update them
+    entities = copy.deepcopy(_ai_cc_oa_entities)
+    
     # Setup mock extract_entities_from_text return value
     entity_linker.extract_entities_from_text.return_value = entities
     
@@ -245,8 +356,7 @@ async def test_extract_enhanced_entities(text_graphrag_agent, sample_markdown):
     assert result["relationship_count"] == 2
     
     # Verify entities_by_type
-    assert EntityType.CONCEPT in result["entities_by_type"]
-    assert EntityType.ORGANIZATION in result["entities_by_type"]
+    assert {EntityType.CONCEPT, EntityType.ORGANIZATION} <= result["entities_by_type"].keys()
     assert len(result["entities_by_type"][EntityType.CONCEPT]) == 2
     
     # Verify entity linker methods were called
@@ -255,42 +365,10 @@ async def test_extract_enhanced_entities(text_graphrag_agent, sample_markdown):
 
 
 @pytest.mark.asyncio
-async def test_analyze_entity_relationships(text_graphrag_agent):
+async def test_analyze_entity_relationships(text_graphrag_agent, _ai_ml_oa_entity_map):
     """Test analyzing entity relationships."""
-    # Setup entity objects
-    entities = [
-        Entity(
-            name="Artificial Intelligence",
-            entity_type=EntityType.CONCEPT,
-            entity_id="entity_ai123",
-            confidence=0.9
-        ),
-        Entity(
-            name="Machine Learning",
-            entity_type=EntityType.CONCEPT,
-            entity_id="entity_ml456",
-            confidence=0.85
-        ),
-        Entity(
-            name="OpenAI",
-            entity_type=EntityType.ORGANIZATION,
-            entity_id="entity_oa789",
-            confidence=0.8
-        )
-    ]
-    
-    # Add relationships
-    entities[0].add_relationship(
-        target_entity_id=entities[1].entity_id,
-        relation_type=RelationType.HAS_PART
-    )
-    entities[2].add_relationship(
-        target_entity_id=entities[0].entity_id,
-        relation_type=RelationType.RELATED_TO
-    )
-    
-    # Store entities
-    text_graphrag_agent.extracted_entities = {entity.entity_id: entity for entity in entities}
+    # Store entities; the handler only reads them, so the shared entities are used as-is
+    text_graphrag_agent.extracted_entities = dict(_ai_ml_oa_entity_map)
     text_graphrag_agent.entity_clusters = []
     
     # Mock entity linker create_entity_map
@@ -319,8 +397,7 @@ async def test_analyze_entity_relationships(text_graphrag_agent):
     assert result["relationship_count"] == 2
     
     # Verify relationship types
-    assert RelationType.HAS_PART in result["relationship_types"]
-    assert RelationType.RELATED_TO in result["relationship_types"]
+    assert {RelationType.HAS_PART, RelationType.RELATED_TO} <= result["relationship_types"].keys()
     
     # Verify entity map was generated
     assert "relationship_map" in result
@@ -328,38 +405,10 @@ async def test_analyze_entity_relationships(text_graphrag_agent):
 
 
 @pytest.mark.asyncio
-async def test_generate_entity_map(text_graphrag_agent):
+async def test_generate_entity_map(text_graphrag_agent, _ai_ml_cc_entity_map):
     """Test entity map generation."""
-    # Setup entity objects
-    entities = [
-        Entity(
-            name="Artificial Intelligence",
-            entity_type=EntityType.CONCEPT,
-            entity_id="entity_ai123",
-            confidence=0.9
-        ),
-        Entity(
-            name="Machine Learning",
-            entity_type=EntityType.CONCEPT,
-            entity_id="entity_ml456",
-            confidence=0.85
-        ),
-        Entity(
-            name="Climate Change",
-            entity_type=EntityType.CONCEPT,
-            entity_id="entity_cc789",
-            confidence=0.8
-        )
-    ]
-    
-    # Add relationships
-    entities[0].add_relationship(
-        target_entity_id=entities[1].entity_id,
-        relation_type=RelationType.HAS_PART
-    )
-    
-    # Store entities
-    text_graphrag_agent.extracted_entities = {entity.entity_id: entity for entity in entities}
+    # Store entities; the handler only reads them, so the shared entities are used as-is
+    text_graphrag_agent.extracted_entities = dict(_ai_ml_cc_entity_map)
     text_graphrag_agent.entity_clusters = []
     
     # Mock entity linker create_entity_map
@@ -1,8 +1,10 @@
 """Tests for the XML Agent functionality."""
 
+import copy
+import types
 import asyncio
 import pytest
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import patch, AsyncMock
 
 from agent_provocateur.a2a_models import TaskRequest, TaskStatus
 from agent_provocateur.xml_agent import XmlAgent
@@ -36,39 +38,43 @@ SAMPLE_XML_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
 </research>"""
 
 
+# Sample document built once; tests get deep copies since handlers may update its nodes
+_SAMPLE_DOC = XmlDocument(
+    doc_id="test_doc",
+    doc_type="xml",
+    title="Test XML",
+    created_at="2023-01-01T00:00:00",
+    updated_at="2023-01-01T00:00:00",
+    content=SAMPLE_XML_CONTENT,
+    root_element="research",
+    namespaces={},
+    researchable_nodes=[
+        XmlNode(
+            xpath="//finding",
+            element_name="finding",
+            content=None,
+            attributes={"id": "f1"},
+            verification_status="pending"
+        ),
+        XmlNode(
+            xpath="//statement",
+            element_name="statement",
+            content="The global temperature has risen by 1.1°C since pre-industrial times.",
+            verification_status="pending"
+        ),
+    ]
+)
+
+
 @pytest.fixture
 def xml_doc():
-    """Create a sample XML document for testing."""
-    return XmlDocument(
-        doc_id="test_doc",
-        doc_type="xml",
-        title="Test XML",
-        created_at="2023-01-01T00:00:00",
-        updated_at="2023-01-01T00:00:00",
-        content=SAMPLE_XML_CONTENT,
-        root_element="research",
-        namespaces={},
-        researchable_nodes=[
-            XmlNode(
-                xpath="//finding",
-                element_name="finding",
-                content=None,
-                attributes={"id": "f1"},
-                verification_status="pending"
-            ),
-            XmlNode(
-                xpath="//statement",
-                element_name="statement",
-                content="The global temperature has risen by 1.1°C since pre-industrial times.",
-                verification_status="pending"
-            ),
-        ]
-    )
+    """Return a copy of the sample XML document for testing."""
+    return _SAMPLE_DOC.copy(deep=True)
 
 
-@pytest.fixture
-def mock_mcp_client():
-    """Create a mock MCP client."""
+@pytest.fixture(scope="module")
+def _mcp_client_mock():
+    """Create the MCP client mock once per module."""
     client = AsyncMock()
     
     # Set up required mock methods
@@ -79,15 +85,36 @@ def mock_mcp_client():
 
 
 @pytest.fixture
-def xml_agent(mock_mcp_client):
-    """Create an XML agent with mocked dependencies."""
+def mock_mcp_client(_mcp_client_mock):
+    """Return the shared MCP client mock with calls and results reset."""
+    _mcp_client_mock.reset_mock(return_value=True, side_effect=True)
+    return _mcp_client_mock
+
+
+@pytest.fixture(scope="module")
+def _base_xml_agent(_mcp_client_mock):
+    """Create the XML agent once, with mocked dependencies."""
     agent = XmlAgent(agent_id="test_xml_agent")
-    agent.async_mcp_client = mock_mcp_client
-    agent.mcp_client = mock_mcp_client
+    agent.async_mcp_client = _mcp_client_mock
+    agent.mcp_client = _mcp_client_mock
+    
+    # No-op messaging; no test asserts on sent results
+    agent.messaging = types.SimpleNamespace(send_task_result=lambda *args, **kwargs: None)
+    
+    return agent, dict(vars(agent))
+
+
+@pytest.fixture
+def xml_agent(_base_xml_agent, mock_mcp_client):
+    """Return the shared XML agent restored to its initial state."""
+    agent, initial_state = _base_xml_agent
     
-    # Mock messaging
-    agent.messaging = MagicMock()
-    agent.messaging.send_task_result = MagicMock()
+    # Drop attributes earlier tests set, and give containers fresh copies
+    vars(agent).clear()
+    vars(agent).update({
+        name: copy.copy(value) if isinstance(value, (dict, list, set)) else value
+        for name, value in initial_state.items()
+    })
     
     # Initialize verification config (needed for tests)
     agent.verification_config = {
@@ -240,4 +267,50 @@ async def test_handle_batch_verify_nodes(xml_agent, xml_doc, mock_mcp_client):
     assert result["total_nodes"] == 2
     assert result["completed_nodes"] == 2
     assert "verification_results" in result
-    assert len(result["verification_results"]) == 2
\ No newline at end of file
+    assert len(result["verification_results"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_handle_batch_verify_nodes_concurrent_search(xml_agent, xml_doc, mock_mcp_client):
+    """Test that web search verification of a batch runs its nodes concurrently."""
+    nodes = [
+        {"xpath": f"//statement[{i}]", "element_name": "statement", "content": f"Statement {i}"}
+        for i in range(1, 5)
+    ]
+    task_request = TaskRequest(
+        task_id="test_task",
+        source_agent="test_agent",
+        target_agent="xml_agent",
+        intent="batch_verify_nodes",
+        payload={
+            "doc_id": "test_doc",
+            "nodes": nodes,
+            "options": {"use_graphrag": False}
+        }
+    )
+    
+    # Search stub that tracks how many searches are in flight at once
+    in_flight = 0
+    max_in_flight = 0
+    
+    async def search(agent_id, intent, payload):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"sources": []}
+    
+    # Configure mock
+    mock_mcp_client.get_xml_document.return_value = xml_doc
+    mock_mcp_client.find_agent_by_capability = AsyncMock(return_value="web_search_agent")
+    mock_mcp_client.send_task_to_agent = AsyncMock(side_effect=search)
+    
+    # Execute
+    result = await xml_agent.handle_batch_verify_nodes(task_request)
+    
+    # Verify all nodes were searched at once and results keep the node order
+    assert max_in_flight == len(nodes)
+    assert result["verification_method"] == "web_search"
+    assert result["completed_nodes"] == len(nodes)
+    assert [r["xpath"] for r in result["verification_results"]] == [n["xpath"] for n in nodes]
@@ -10,17 +10,6 @@ from agent_provocateur.a2a_models import TaskRequest
 from agent_provocateur.xml_agent import XmlAgent
 
 
-@pytest.fixture
-def entity_test_xml() -> str:
-    """Load entity test XML file."""
-    test_file = os.path.join(
-        os.path.dirname(__file__),
-        "test_data/xml_documents/entity_test.xml"
-    )
-    with open(test_file, "r") as f:
-        return f.read()
-
-
 @pytest.fixture
 def docbook_test_xml() -> str:
     """Load DocBook test XML file."""